@@ -33,40 +33,72 @@ __email__ = "mh3as81gb@mozmail.com"
 __description__ = "A comprehensive Python wrapper for the Popcat API"
 __url__ = "https://github.com/LandWarderer2772/pop-wrapper"
 
-# Import all modules for easy access
-from .image import *
-from .meme import *
-from .data import *
-from .text import *
-from .random import *
-from .utilities import *
-from .classes import *
+import importlib
 
-# Define what gets imported with "from popcat import *"
-__all__ = [
+# Public names and the submodule that defines them. Submodules are imported on
+# first attribute access (PEP 562), so ``import popcat`` stays cheap. Each tuple
+# mirrors the submodule's own ``__all__``; tests/test_package.py checks they agree.
+_EXPORTS = {
     # Image manipulation functions
-    'jail', 'blur', 'invert', 'greyscale', 'drip', 'clown', 'colorify', 
-    'wanted', 'gun', 'ad', 'uncover', 'communism', 'jokeoverhead', 'mnm',
+    "image": (
+        'jail', 'blur', 'invert', 'greyscale', 'drip', 'clown', 'colorify', 
+        'wanted', 'gun', 'ad', 'uncover', 'communism', 'jokeoverhead', 'mnm',
+    ),
     
     # Meme generation functions
-    'drake', 'pooh', 'ship', 'supreme', 'oogway', 'biden', 'pikachu', 
-    'sadcat', 'opinion', 'discord_message', 'quote', 'happysad', 
-    'unforgivable', 'couldread', 'lulcat', 'facts', 'alert', 'caution',
+    "meme": (
+        'drake', 'pooh', 'ship', 'supreme', 'oogway', 'biden', 'pikachu', 
+        'sadcat', 'opinion', 'discord_message', 'quote', 'happysad', 
+        'unforgivable', 'couldread', 'lulcat', 'facts', 'alert', 'caution',
+    ),
     
     # Data API functions
-    'weather', 'github', 'npm', 'steam', 'imdb', 'country', 'periodic_table',
-    'colorinfo', 'randomcolor', 'subreddit', 'itunes',
+    "data": (
+        'weather', 'github', 'npm', 'steam', 'imdb', 'country', 'periodic_table',
+        'colorinfo', 'randomcolor', 'subreddit', 'itunes',
+    ),
     
     # Text utility functions
-    'translate', 'reverse', 'mock', 'doublestruck', 'texttomorse', 'encode', 'decode',
+    "text": (
+        'translate', 'translate_batch', 'reverse', 'mock', 'doublestruck', 'texttomorse',
+        'encode', 'decode',
+    ),
     
     # Random content functions
-    'joke', 'fact', 'randommeme', 'car', 'showerthought', 'wouldyourather', 
-    'eightball', '_8ball',
+    "random": (
+        'joke', 'fact', 'randommeme', 'car', 'showerthought', 'wouldyourather', 
+        'eightball', '_8ball',
+    ),
     
     # Utility functions
-    'lyrics', 'screenshot', 'chatbot', 'welcomecard',
+    "utilities": ('lyrics', 'screenshot', 'chatbot', 'welcomecard', 'batch', 'BatchError'),
     
     # Specialized classes
-    'CodeClient', 'Shortener'
-]
\ No newline at end of file
+    "classes": ('CodeClient', 'Shortener'),
+    
+    # Cache and transport management
+    "_cache": ('clear_cache',),
+    "_http": ('PopcatAPIError', 'close', 'set_backend', 'set_timeout'),
+}
+
+_NAME_TO_MODULE = {name: module for module, names in _EXPORTS.items() for name in names}
+
+_SUBMODULES = frozenset({'image', 'meme', 'data', 'text', 'random', 'utilities', 'classes', 'aio'})
+
+def __getattr__(name: str):
+    """Import the submodule providing ``name`` on first access."""
+    module = _NAME_TO_MODULE.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted({*globals(), *_NAME_TO_MODULE, *_SUBMODULES})
+
+# Define what gets imported with "from popcat import *"
+__all__ = sorted(_NAME_TO_MODULE)
@@ -0,0 +1,115 @@
+"""
+In-memory response caching for the Popcat API modules.
+
+Provides a small thread-safe LRU cache with optional time-to-live, a decorator
+for cache-aside lookups and :func:`clear_cache` to invalidate every cache at once.
+"""
+
+import functools
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+# Every cache created by this module, so clear_cache() can reach them all
+_CACHES = weakref.WeakSet()
+
+_MISSING = object()
+
+class TTLCache:
+    """
+    A thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    Args:
+        maxsize (int): Maximum number of entries before the least recently used is evicted
+        ttl (float, optional): Entry lifetime in seconds. ``None`` keeps entries until evicted
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        _CACHES.add(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            value, expires = item
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove ``key`` from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """Build a hashable key, turning dict arguments (request params) into frozensets."""
+    key = tuple(frozenset(arg.items()) if isinstance(arg, dict) else arg for arg in args)
+    if kwargs:
+        key += (frozenset(kwargs.items()),)
+    return key
+
+def _copy(value: Any) -> Any:
+    """Return a shallow copy of a dict or list, or any other value unchanged."""
+    return value.copy() if isinstance(value, (dict, list)) else value
+
+def cached(cache: TTLCache) -> Callable:
+    """
+    Decorate a function so its results are stored in ``cache``.
+
+    Every caller gets a shallow copy of a cached dict or list, so adding or
+    replacing top-level keys does not change what later callers see.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache[key] = value
+            return _copy(value)
+        return wrapper
+    return decorator
+
+def clear_cache() -> None:
+    """
+    Clear every cached API response.
+
+    Example:
+        >>> import popcat
+        >>> popcat.clear_cache()
+    """
+    for cache in list(_CACHES):
+        cache.clear()
+
+# Shared cache for deterministic endpoint responses
+RESPONSE_CACHE = TTLCache(maxsize=512, ttl=3600)
+
+# Export all functions
+__all__ = ['clear_cache']
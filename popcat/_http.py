@@ -0,0 +1,386 @@
+"""
+Shared HTTP plumbing for the Popcat API modules.
+
+All endpoint modules go through a single pooled ``requests.Session`` so that
+consecutive calls reuse the same keep-alive connection instead of paying a
+fresh TCP + TLS handshake every time. :func:`set_backend` can switch requests
+over to an ``httpx`` client that multiplexes them over one HTTP/2 connection, or
+to a bare ``urllib3`` pool that skips the requests layer.
+JSON bodies are decoded with ``orjson`` when it is installed.
+"""
+
+import importlib.util
+import warnings
+from json import dumps as _dumps
+from typing import Dict, Optional
+from urllib.parse import urlencode, quote_plus, urlsplit
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    from json import loads as _loads
+
+from . import __version__
+from ._cache import RESPONSE_CACHE, cached
+
+# Base URL for the Popcat API
+BASE_URL = "https://api.popcat.xyz"
+
+# Default (connect, read) timeouts in seconds. The connect timeout sits just above
+# a multiple of 3s, the TCP retransmission window; the read timeout caps how long a
+# hung server can stall a call. Read on every request, so set_timeout() applies at once.
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Headers sent with every request
+DEFAULT_HEADERS = {
+    "User-Agent": f"pop-wrapper/{__version__}",
+}
+
+class PopcatAPIError(Exception):
+    """
+    Raised when a request to the Popcat API fails.
+
+    The underlying transport error is chained as ``__cause__``.
+
+    Attributes:
+        status (Optional[int]): HTTP status code, or ``None`` if no response was received
+        endpoint (Optional[str]): Endpoint path of the failed request, such as ``"/weather"``
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None, endpoint: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.endpoint = endpoint
+
+def _api_error(error: Exception, url: str, status: Optional[int] = None) -> PopcatAPIError:
+    """Wrap a backend error for the request to ``url``."""
+    return PopcatAPIError(f"API request failed: {str(error)}", status=status, endpoint=urlsplit(url).path)
+
+def _decode_json(response):
+    """Decode a JSON response body, raising PopcatAPIError if it is not valid JSON."""
+    try:
+        return _loads(response.content)
+    except ValueError as e:
+        raise _api_error(e, str(response.url), response.status_code) from e
+
+# requests (and urllib3 with it) is imported when the first request is made rather
+# than at import time, so importing popcat stays cheap. ``SESSION`` and ``requests``
+# remain available as module attributes through __getattr__ below.
+_SESSION = None
+
+def _create_retry() -> "urllib3.util.retry.Retry":
+    """Create the retry policy for transient errors shared by the requests and urllib3 backends."""
+    from urllib3.util.retry import Retry
+
+    return Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        # POST creates pastes and short URLs, so it is never replayed
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False,
+    )
+
+def _create_session() -> "requests.Session":
+    """Create a session with connection pooling and retries on transient errors."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=_create_retry())
+    session.mount("https://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    # Only the codings urllib3 can decode here (gzip and deflate, plus br/zstd
+    # when their packages are installed)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+def _get_session() -> "requests.Session":
+    """Return the shared session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _create_session()
+    return _SESSION
+
+def __getattr__(name: str):
+    if name == "SESSION":
+        return _get_session()
+    if name == "requests":
+        import requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Available HTTP backends and the one currently in use
+_BACKENDS = ("requests", "httpx", "urllib3")
+_backend = "requests"
+
+# httpx client, created on first use when the httpx backend is selected
+_CLIENT = None
+
+# urllib3 pool, created on first use when the urllib3 backend is selected
+_POOL = None
+
+def set_backend(name: str) -> None:
+    """
+    Select the HTTP library used for API requests.
+    
+    Args:
+        name (str): "requests" (default), "httpx" or "urllib3". The httpx backend
+            multiplexes concurrent requests over a single HTTP/2 connection and needs
+            the optional dependency: pip install pop-wrapper[http2]. The urllib3
+            backend drives the connection pool underneath requests directly,
+            skipping its per-request session and response bookkeeping
+            
+    Raises:
+        ValueError: If the backend name is unknown
+        
+    Example:
+        >>> import popcat
+        >>> popcat.set_backend("httpx")
+    """
+    global _backend
+    if name not in _BACKENDS:
+        raise ValueError(f"Backend must be one of: {', '.join(_BACKENDS)}")
+    if name == "httpx" and importlib.util.find_spec("httpx") is None:
+        warnings.warn("httpx is not installed, falling back to requests", RuntimeWarning)
+        name = "requests"
+    _backend = name
+
+def set_timeout(connect: float, read: float) -> None:
+    """
+    Set the connect and read timeouts, in seconds, used for API requests.
+    
+    Applies to the next request on every synchronous backend, and to
+    :class:`~popcat.aio.AsyncPopcat` clients created afterwards.
+    
+    Args:
+        connect (float): Seconds to wait for a connection. Defaults to 3.05
+        read (float): Seconds to wait between bytes of the response. Defaults to 10
+        
+    Raises:
+        ValueError: If either timeout is not positive
+        
+    Example:
+        >>> import popcat
+        >>> popcat.set_timeout(3.05, 30)
+    """
+    global DEFAULT_TIMEOUT
+    if not connect > 0 or not read > 0:
+        raise ValueError("Timeouts must be positive")
+    DEFAULT_TIMEOUT = (connect, read)
+
+def _get_client() -> "httpx.Client":
+    """Return the shared httpx client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        import httpx
+
+        _CLIENT = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            headers=DEFAULT_HEADERS,
+            # Matches the requests pool size; HTTP/2 multiplexes streams over fewer of them
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _CLIENT
+
+# TLS context for the urllib3 pool, built on first use
+_SSL_CONTEXT = None
+
+def _get_ssl_context() -> "ssl.SSLContext":
+    """
+    Return a TLS context with the CA bundle already loaded.
+
+    Without one, urllib3 builds a context and parses the CA bundle again for every
+    new connection. ALPN is left unset: urllib3 only speaks HTTP/1.1.
+    """
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        import ssl
+
+        try:
+            import certifi
+            cafile = certifi.where()
+        except ImportError:  # pragma: no cover - certifi ships with requests
+            cafile = None
+        _SSL_CONTEXT = ssl.create_default_context(cafile=cafile)
+    return _SSL_CONTEXT
+
+def _get_pool() -> "urllib3.PoolManager":
+    """Return the shared urllib3 pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        import urllib3
+        from urllib3.util.request import ACCEPT_ENCODING
+
+        _POOL = urllib3.PoolManager(
+            num_pools=20,
+            maxsize=100,
+            ssl_context=_get_ssl_context(),
+            retries=_create_retry(),
+            headers={**DEFAULT_HEADERS, "Accept-Encoding": ACCEPT_ENCODING},
+        )
+    return _POOL
+
+class _Response:
+    """The parts of a requests or httpx response the endpoint modules use, for urllib3."""
+
+    __slots__ = ("status_code", "headers", "content", "url")
+
+    def __init__(self, status_code: int, headers, content: bytes, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        _, _, charset = self.headers.get("Content-Type", "").partition("charset=")
+        return self.content.decode(charset.split(";")[0].strip() or "utf-8", "replace")
+
+    def json(self):
+        return _decode_json(self)
+
+def _urllib3_request(method: str, url: str, params: dict = None, json: dict = None,
+                     headers: dict = None) -> _Response:
+    """Perform a request with the urllib3 backend."""
+    import urllib3
+
+    pool = _get_pool()
+    body = None
+    if json is not None:
+        body = _dumps(json).encode("utf-8")
+        headers = {"Content-Type": "application/json", **(headers or {})}
+    if headers:
+        # Per-request headers replace the pool's defaults rather than adding to them
+        headers = {**pool.headers, **headers}
+    if params:
+        url += "?" + urlencode(params, quote_via=quote_plus)
+    try:
+        response = pool.request(method, url, body=body, headers=headers,
+                                timeout=urllib3.Timeout(connect=DEFAULT_TIMEOUT[0], read=DEFAULT_TIMEOUT[1]))
+    except urllib3.exceptions.HTTPError as e:
+        raise _api_error(e, url) from e
+    if response.status >= 400:
+        raise PopcatAPIError(f"API request failed: {response.status} {response.reason} for url: {url}",
+                             status=response.status, endpoint=urlsplit(url).path)
+    return _Response(response.status, response.headers, response.data, response.geturl() or url)
+
+# Full URL per endpoint path, computed once instead of formatted on every call.
+# Bounded because some paths embed user input (e.g. /shorten/<extension>).
+_URLS: Dict[str, str] = {}
+_MAX_URLS = 256
+
+def url_for(endpoint: str) -> str:
+    """Return the full URL for an endpoint path."""
+    url = _URLS.get(endpoint)
+    if url is None:
+        url = BASE_URL + endpoint
+        if len(_URLS) < _MAX_URLS:
+            _URLS[endpoint] = url
+    return url
+
+def build_url(endpoint: str, params: dict) -> str:
+    """
+    Build the full URL for an endpoint locally, without contacting the API.
+
+    Parameters are encoded with ``quote_plus``, matching the URLs requests produced.
+    """
+    return url_for(endpoint) + "?" + urlencode(params, quote_via=quote_plus)
+
+def _request_url(method: str, url: str, params: dict = None, **kwargs):
+    """
+    Perform a request against a full API URL with the selected backend, following redirects.
+
+    Extra keyword arguments such as ``json`` or ``headers`` are passed to the backend.
+    """
+    if _backend == "urllib3":
+        return _urllib3_request(method, url, params, **kwargs)
+    if _backend == "httpx":
+        import httpx
+
+        try:
+            response = _get_client().request(method, url, params=params, follow_redirects=True,
+                                             timeout=httpx.Timeout(DEFAULT_TIMEOUT[1], connect=DEFAULT_TIMEOUT[0]),
+                                             **kwargs)
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            raise _api_error(e, url, e.response.status_code) from e
+        except httpx.HTTPError as e:
+            raise _api_error(e, url) from e
+    import requests
+
+    try:
+        response = _get_session().request(method, url, params=params,
+                                   timeout=DEFAULT_TIMEOUT, allow_redirects=True, **kwargs)
+        response.raise_for_status()
+        return response
+    except requests.RequestException as e:
+        raise _api_error(e, url, getattr(e.response, "status_code", None)) from e
+
+def _request(method: str, endpoint: str, params: dict = None, **kwargs):
+    """Perform a request against an API endpoint path, see :func:`_request_url`."""
+    return _request_url(method, url_for(endpoint), params, **kwargs)
+
+def get(endpoint: str, params: dict = None):
+    """Perform a GET request against the API."""
+    return _request("GET", endpoint, params)
+
+def get_url(url: str, params: dict = None):
+    """Perform a GET request against a full API URL."""
+    return _request_url("GET", url, params)
+
+def head(endpoint: str, params: dict = None):
+    """Perform a HEAD request against the API."""
+    return _request("HEAD", endpoint, params)
+
+def post(endpoint: str, json: dict = None, headers: dict = None):
+    """Perform a POST request with a JSON body against the API."""
+    return _request("POST", endpoint, json=json, headers=headers)
+
+def get_json(endpoint: str, params: dict = None):
+    """Perform a GET request against the API and return the decoded JSON body."""
+    return _decode_json(get(endpoint, params))
+
+def get_json_url(url: str, params: dict = None):
+    """Perform a GET request against a full API URL and return the decoded JSON body."""
+    return _decode_json(get_url(url, params))
+
+def post_json(endpoint: str, json: dict = None, headers: dict = None):
+    """Perform a POST request with a JSON body and return the decoded JSON response."""
+    return _decode_json(post(endpoint, json=json, headers=headers))
+
+def resolve_url(endpoint: str, params: dict) -> str:
+    """Resolve an image URL with a HEAD request, without downloading the image."""
+    return str(head(endpoint, params).url)
+
+@cached(RESPONSE_CACHE)
+def verified_url(endpoint: str, params: dict) -> str:
+    """Confirm an image URL with a HEAD request and return the final URL."""
+    return resolve_url(endpoint, params)
+
+def close() -> None:
+    """
+    Close the pooled connections of the shared session, httpx client and urllib3 pool.
+
+    A new pool is opened on the next request, so this is safe to call at any time,
+    for example when shutting down or between tests.
+
+    Example:
+        >>> import popcat
+        >>> popcat.close()
+    """
+    global _SESSION, _CLIENT, _POOL
+    if _POOL is not None:
+        _POOL.clear()
+        _POOL = None
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+    if _CLIENT is not None:
+        _CLIENT.close()
+        _CLIENT = None
+
+# Export all functions
+__all__ = ['PopcatAPIError', 'close', 'set_backend', 'set_timeout']
@@ -0,0 +1,39 @@
+"""
+Input validation helpers shared by the Popcat API modules.
+"""
+
+from typing import Optional
+from urllib.parse import SplitResult, urlsplit
+
+def _validate_text(text: str, max_length: Optional[int] = None) -> None:
+    """Validate that the provided text is valid."""
+    if not text or not isinstance(text, str):
+        raise ValueError("Text must be a non-empty string")
+    if max_length and len(text) > max_length:
+        raise ValueError(f"Text must be {max_length} characters or less")
+
+def _validate_texts(*texts: str) -> None:
+    """Validate several required text arguments in a single call."""
+    for text in texts:
+        if not text or not isinstance(text, str):
+            raise ValueError("Text must be a non-empty string")
+
+def _validate_image_url(image_url: str) -> None:
+    """Validate that the provided string is a valid image URL."""
+    if not image_url or not isinstance(image_url, str):
+        raise ValueError("Image URL must be a non-empty string")
+    if not image_url.startswith(('http://', 'https://')):
+        raise ValueError("Image URL must start with http:// or https://")
+
+def _validate_url(url: str) -> SplitResult:
+    """Validate that the provided string is a valid URL and return its parsed parts."""
+    if not url or not isinstance(url, str):
+        raise ValueError("URL must be a non-empty string")
+    
+    parsed = urlsplit(url)
+    if not parsed.scheme or not parsed.netloc:
+        raise ValueError("URL must be a valid HTTP/HTTPS URL")
+    
+    if parsed.scheme not in ('http', 'https'):
+        raise ValueError("URL must use HTTP or HTTPS protocol")
+    return parsed
@@ -0,0 +1,541 @@
+"""
+Async API Module
+
+This module provides an asyncio-based client for the Popcat API built on aiohttp.
+Independent calls can be issued concurrently with ``asyncio.gather`` instead of
+paying one round trip after another.
+
+Requires the optional ``aiohttp`` dependency::
+
+    pip install pop-wrapper[async]
+
+or, to multiplex requests over one HTTP/2 connection with ``httpx`` instead
+(``AsyncPopcat(http2=True)`` or ``POPCAT_HTTP2=1``)::
+
+    pip install pop-wrapper[http2]
+
+Example:
+    import asyncio
+    from popcat.aio import AsyncPopcat
+
+    async def main():
+        async with AsyncPopcat() as popcat:
+            drake, logo, jailed = await asyncio.gather(
+                popcat.drake("Sequential calls", "Concurrent calls"),
+                popcat.supreme("POPCAT"),
+                popcat.jail("https://example.com/image.png"),
+            )
+
+    asyncio.run(main())
+
+Available Classes:
+    - AsyncPopcat: Async client mirroring the synchronous endpoint functions
+"""
+
+import asyncio
+import importlib.util
+import os
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the extra
+    aiohttp = None
+
+from . import _http
+from ._http import BASE_URL, DEFAULT_HEADERS, PopcatAPIError, _Response, build_url
+from ._validate import _validate_text, _validate_texts, _validate_image_url, _validate_url
+from .data import _ENDPOINTS as _DATA_ENDPOINTS
+from .random import _ENDPOINTS as _RANDOM_ENDPOINTS, _parse_body
+from .text import _DS_TABLE, _decode_binary, _validate_binary
+from .utilities import _validate_background
+
+class AsyncPopcat:
+    """
+    An asyncio client for the Popcat API.
+
+    Every method mirrors the synchronous function of the same name in
+    :mod:`popcat.image`, :mod:`popcat.meme`, :mod:`popcat.data`,
+    :mod:`popcat.text`, :mod:`popcat.random` or :mod:`popcat.utilities`, with
+    identical validation and return values, but must be awaited.
+
+    The underlying ``aiohttp.ClientSession`` is created on first use and pooled
+    across calls. Use the client as an async context manager, or call
+    :meth:`close` when done.
+
+    Example:
+        >>> async with AsyncPopcat() as popcat:
+        ...     meme = await popcat.drake("Using other APIs", "Using Popcat API")
+        >>> print(meme)
+        https://api.popcat.xyz/drake?text1=...&text2=...
+    """
+
+    def __init__(self, limit: int = 20, keepalive_timeout: float = 30, http2: Optional[bool] = None):
+        """
+        Initialize the async client.
+
+        Args:
+            limit (int, optional): Maximum number of simultaneous connections. Defaults to 20
+            keepalive_timeout (float, optional): Seconds to keep idle connections open. Defaults to 30
+            http2 (bool, optional): Send requests through an ``httpx`` client that multiplexes
+                them over one HTTP/2 connection instead of aiohttp. Defaults to the
+                ``POPCAT_HTTP2`` environment variable being set to ``1``
+
+        Raises:
+            ImportError: If the selected HTTP library is not installed
+        """
+        if http2 is None:
+            http2 = os.environ.get("POPCAT_HTTP2") == "1"
+        if http2:
+            if importlib.util.find_spec("httpx") is None:
+                raise ImportError("AsyncPopcat(http2=True) requires httpx: pip install pop-wrapper[http2]")
+        elif aiohttp is None:
+            raise ImportError("AsyncPopcat requires aiohttp: pip install pop-wrapper[async]")
+        self._http2 = http2
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = _http.DEFAULT_TIMEOUT
+        self._session = None
+        self._client = None
+        self._base_url = BASE_URL
+        self._urls = {}
+
+    async def __aenter__(self) -> "AsyncPopcat":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit,
+                    keepalive_timeout=self._keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(sock_connect=self._timeout[0], sock_read=self._timeout[1]),
+                headers={"User-Agent": DEFAULT_HEADERS["User-Agent"]},
+            )
+        return self._session
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the httpx client used when ``http2`` is set, creating it on first use."""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                headers=DEFAULT_HEADERS,
+                limits=httpx.Limits(max_connections=self._limit, keepalive_expiry=self._keepalive_timeout),
+                timeout=httpx.Timeout(self._timeout[1], connect=self._timeout[0]),
+            )
+        return self._client
+
+    def _url(self, endpoint: str) -> str:
+        """Return the full URL for an endpoint path, computed once per client."""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self._base_url + endpoint
+        return url
+
+    async def _fetch(self, method: str, endpoint: str, params: Optional[dict] = None) -> _Response:
+        """Perform a request with the selected HTTP library and return the buffered response."""
+        if self._http2:
+            import httpx
+
+            try:
+                response = await self._get_client().request(method, self._url(endpoint), params=params,
+                                                            follow_redirects=True)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise PopcatAPIError(f"API request failed: {str(e)}", status=e.response.status_code,
+                                     endpoint=endpoint) from e
+            except httpx.HTTPError as e:
+                raise PopcatAPIError(f"API request failed: {str(e)}", endpoint=endpoint) from e
+            return _Response(response.status_code, response.headers, response.content, str(response.url))
+        try:
+            async with self._get_session().request(method, self._url(endpoint), params=params,
+                                                   allow_redirects=True) as response:
+                response.raise_for_status()
+                return _Response(response.status, response.headers, await response.read(), str(response.url))
+        except aiohttp.ClientError as e:
+            raise PopcatAPIError(f"API request failed: {str(e)}", status=getattr(e, "status", None),
+                                 endpoint=endpoint) from e
+
+    async def _make_request(self, endpoint: str, params: dict, verify: bool = False) -> str:
+        """Return the image URL, optionally confirming it with a HEAD request."""
+        if not verify:
+            return build_url(endpoint, params)
+        return (await self._fetch("HEAD", endpoint, params)).url
+
+    async def _make_json_request(self, endpoint: str, params: dict) -> Dict[str, Any]:
+        """Make a request to the API and return JSON data."""
+        return (await self._fetch("GET", endpoint, params)).json()
+
+    async def _make_text_request(self, endpoint: str, params: dict, key: str = 'text') -> str:
+        """Make a request to the API and return the ``key`` field of the JSON result."""
+        response = await self._fetch("GET", endpoint, params)
+
+        # Only JSON responses need parsing; anything else is the text itself
+        if 'json' in response.headers.get('Content-Type', ''):
+            data = response.json()
+            if key in data:
+                return data[key]
+        return response.text
+
+    async def _make_random_request(self, endpoint: str):
+        """Make a request to the API and return the main content of the result."""
+        response = await self._fetch("GET", endpoint)
+        return _parse_body(response.content, response.text)
+
+    # Image manipulation
+
+    async def jail(self, image_url: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.jail`."""
+        _validate_image_url(image_url)
+        return await self._make_request("/jail", {"image": image_url}, verify=verify)
+
+    async def blur(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.blur`."""
+        _validate_image_url(image)
+        return await self._make_request("/blur", {"image": image}, verify=verify)
+
+    async def invert(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.invert`."""
+        _validate_image_url(image)
+        return await self._make_request("/invert", {"image": image}, verify=verify)
+
+    async def greyscale(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.greyscale`."""
+        _validate_image_url(image)
+        return await self._make_request("/greyscale", {"image": image}, verify=verify)
+
+    async def drip(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.drip`."""
+        _validate_image_url(image)
+        return await self._make_request("/drip", {"image": image}, verify=verify)
+
+    async def clown(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.clown`."""
+        _validate_image_url(image)
+        return await self._make_request("/clown", {"image": image}, verify=verify)
+
+    async def colorify(self, image: str, color: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.colorify`."""
+        _validate_image_url(image)
+        if not color or not isinstance(color, str):
+            raise ValueError("Color must be a non-empty string")
+        return await self._make_request("/colorify", {"image": image, "color": color}, verify=verify)
+
+    async def wanted(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.wanted`."""
+        _validate_image_url(image)
+        return await self._make_request("/wanted", {"image": image}, verify=verify)
+
+    async def gun(self, image: str, text: Optional[str] = None, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.gun`."""
+        _validate_image_url(image)
+        params = {"image": image}
+        if text:
+            params["text"] = text
+        return await self._make_request("/gun", params, verify=verify)
+
+    async def ad(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.ad`."""
+        _validate_image_url(image)
+        return await self._make_request("/ad", {"image": image}, verify=verify)
+
+    async def uncover(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.uncover`."""
+        _validate_image_url(image)
+        return await self._make_request("/uncover", {"image": image}, verify=verify)
+
+    async def communism(self, image_url: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.communism`."""
+        _validate_image_url(image_url)
+        return await self._make_request("/communism", {"image": image_url}, verify=verify)
+
+    async def jokeoverhead(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.jokeoverhead`."""
+        _validate_image_url(image)
+        return await self._make_request("/jokeoverhead", {"image": image}, verify=verify)
+
+    async def mnm(self, image: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.image.mnm`."""
+        _validate_image_url(image)
+        return await self._make_request("/mnm", {"image": image}, verify=verify)
+
+    # Meme generation
+
+    async def drake(self, text1: str, text2: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.drake`."""
+        _validate_text(text1)
+        _validate_text(text2)
+        return await self._make_request("/drake", {"text1": text1, "text2": text2}, verify=verify)
+
+    async def pooh(self, text1: str, text2: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.pooh`."""
+        _validate_text(text1)
+        _validate_text(text2)
+        return await self._make_request("/pooh", {"text1": text1, "text2": text2}, verify=verify)
+
+    async def ship(self, image1: str, image2: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.ship`."""
+        _validate_image_url(image1)
+        _validate_image_url(image2)
+        return await self._make_request("/ship", {"user1": image1, "user2": image2}, verify=verify)
+
+    async def supreme(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.supreme`."""
+        _validate_text(text)
+        return await self._make_request("/supreme", {"text": text}, verify=verify)
+
+    async def oogway(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.oogway`."""
+        _validate_text(text)
+        return await self._make_request("/oogway", {"text": text}, verify=verify)
+
+    async def biden(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.biden`."""
+        _validate_text(text)
+        return await self._make_request("/biden", {"text": text}, verify=verify)
+
+    async def pikachu(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.pikachu`."""
+        _validate_text(text)
+        return await self._make_request("/pikachu", {"text": text}, verify=verify)
+
+    async def sadcat(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.sadcat`."""
+        _validate_text(text)
+        return await self._make_request("/sadcat", {"text": text}, verify=verify)
+
+    async def opinion(self, image: str, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.opinion`."""
+        _validate_image_url(image)
+        _validate_text(text)
+        return await self._make_request("/opinion", {"image": image, "text": text}, verify=verify)
+
+    async def discord_message(self, username: str, content: str, avatar: Optional[str] = None,
+                              color: Optional[str] = None, timestamp: Optional[str] = None,
+                              verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.discord_message`."""
+        _validate_text(username)
+        _validate_text(content)
+
+        params = {"username": username, "content": content}
+        if avatar:
+            _validate_image_url(avatar)
+            params["avatar"] = avatar
+        if color:
+            params["color"] = color
+        if timestamp:
+            params["timestamp"] = timestamp
+
+        return await self._make_request("/discord", params, verify=verify)
+
+    async def quote(self, image: str, text: str, name: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.quote`."""
+        _validate_image_url(image)
+        _validate_text(text, max_length=125)
+        _validate_text(name)
+        return await self._make_request("/quote", {"image": image, "text": text, "name": name}, verify=verify)
+
+    async def happysad(self, text1: str, text2: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.happysad`."""
+        _validate_text(text1)
+        _validate_text(text2)
+        return await self._make_request("/happysad", {"text1": text1, "text2": text2}, verify=verify)
+
+    async def unforgivable(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.unforgivable`."""
+        _validate_text(text)
+        return await self._make_request("/unforgivable", {"text": text}, verify=verify)
+
+    async def couldread(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.couldread`."""
+        _validate_text(text)
+        return await self._make_request("/couldread", {"text": text}, verify=verify)
+
+    async def lulcat(self, text: str) -> Dict[str, Any]:
+        """Async version of :func:`popcat.meme.lulcat`."""
+        _validate_text(text)
+        return await self._make_json_request("/lulcat", {"text": text})
+
+    async def facts(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.facts`."""
+        _validate_text(text)
+        return await self._make_request("/facts", {"text": text}, verify=verify)
+
+    async def alert(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.alert`."""
+        _validate_text(text)
+        return await self._make_request("/alert", {"text": text}, verify=verify)
+
+    async def caution(self, text: str, verify: bool = False) -> str:
+        """Async version of :func:`popcat.meme.caution`."""
+        _validate_text(text)
+        return await self._make_request("/caution", {"text": text}, verify=verify)
+
+    # Text utilities
+
+    async def translate(self, text: str, to: str) -> str:
+        """Async version of :func:`popcat.text.translate`."""
+        _validate_text(text)
+        _validate_text(to)
+        return await self._make_text_request("/translate", {"text": text, "to": to}, 'translated')
+
+    async def translate_many(self, items: Iterable[Tuple[str, str]]) -> List[str]:
+        """
+        Translate several texts concurrently.
+
+        Args:
+            items (Iterable[Tuple[str, str]]): ``(text, to)`` pairs
+
+        Returns:
+            List[str]: Translations in the same order as ``items``
+
+        Raises:
+            ValueError: If any text or language code is invalid
+            PopcatAPIError: If any API request fails
+
+        Example:
+            >>> async with AsyncPopcat() as popcat:
+            ...     spanish, french = await popcat.translate_many([("Hello", "es"), ("Hello", "fr")])
+        """
+        return list(await asyncio.gather(*(self.translate(text, to) for text, to in items)))
+
+    async def reverse(self, text: str, remote: bool = False) -> str:
+        """Async version of :func:`popcat.text.reverse`."""
+        _validate_text(text)
+        if not remote:
+            return text[::-1]
+        return await self._make_text_request("/reverse", {"text": text})
+
+    async def mock(self, text: str) -> str:
+        """Async version of :func:`popcat.text.mock`."""
+        _validate_text(text)
+        return await self._make_text_request("/mock", {"text": text})
+
+    async def doublestruck(self, text: str, remote: bool = False) -> str:
+        """Async version of :func:`popcat.text.doublestruck`."""
+        _validate_text(text)
+        if not remote:
+            return text.translate(_DS_TABLE)
+        return await self._make_text_request("/doublestruck", {"text": text})
+
+    async def texttomorse(self, text: str) -> str:
+        """Async version of :func:`popcat.text.texttomorse`."""
+        _validate_text(text)
+        return await self._make_text_request("/texttomorse", {"text": text}, 'morse')
+
+    async def encode(self, text: str, remote: bool = False) -> str:
+        """Async version of :func:`popcat.text.encode`."""
+        _validate_text(text)
+        if not remote:
+            return ' '.join(format(byte, '08b') for byte in text.encode('utf-8'))
+        return await self._make_text_request("/encode", {"text": text}, 'binary')
+
+    async def decode(self, binary: str, remote: bool = False) -> str:
+        """Async version of :func:`popcat.text.decode`."""
+        _validate_binary(binary)
+        if not remote:
+            return _decode_binary(binary)
+        return await self._make_text_request("/decode", {"binary": binary}, 'decoded')
+
+    # Data and random methods are generated from the sync modules' endpoint tables below
+
+    # Utilities
+
+    async def lyrics(self, song: str) -> Dict[str, Any]:
+        """Async version of :func:`popcat.utilities.lyrics`."""
+        _validate_text(song)
+        return await self._make_json_request("/lyrics", {"song": song})
+
+    async def screenshot(self, url: str) -> str:
+        """Async version of :func:`popcat.utilities.screenshot`."""
+        _validate_url(url)
+        return await self._make_request("/screenshot", {"url": url}, verify=True)
+
+    async def chatbot(self, message: str, ownername: str, botname: str) -> Dict[str, Any]:
+        """Async version of :func:`popcat.utilities.chatbot`."""
+        _validate_texts(message, ownername, botname)
+        return await self._make_json_request("/chatbot", {
+            "msg": message,
+            "owner": ownername,
+            "botname": botname
+        })
+
+    async def welcomecard(self, background: str, avatar: str, text_1: str, text_2: str, text_3: str) -> str:
+        """Async version of :func:`popcat.utilities.welcomecard`."""
+        _validate_background(background)
+        _validate_url(avatar)
+        _validate_texts(text_1, text_2, text_3)
+        return await self._make_request("/welcomecard", {
+            "background": background,
+            "avatar": avatar,
+            "text1": text_1,
+            "text2": text_2,
+            "text3": text_3
+        }, verify=True)
+
+# Source template for the async data methods. Like the synchronous functions in
+# popcat.data, they are generated so the argument keeps its documented name, and
+# they accept only exact str.
+_DATA_METHOD_TEMPLATE = """
+async def {name}(self, {arg}: str) -> Dict[str, Any]:
+    if type({arg}) is not str or not {arg}:
+        raise ValueError("Text must be a non-empty string"){preprocess}
+    return await self._make_json_request({endpoint!r}, {{{param!r}: {arg}}})
+"""
+
+def _make_data_method(name: str, endpoint: str, param: Optional[str], arg: Optional[str], preprocess):
+    """Create the async twin of a :mod:`popcat.data` function."""
+    if param is None:
+        async def method(self) -> Dict[str, Any]:
+            return await self._make_json_request(endpoint, {})
+    else:
+        namespace = {'__name__': __name__, 'Dict': Dict, 'Any': Any, 'preprocess': preprocess}
+        source = _DATA_METHOD_TEMPLATE.format(
+            name=name, arg=arg, param=param, endpoint=endpoint,
+            preprocess=f"\n    {arg} = preprocess({arg})" if preprocess is not None else "",
+        )
+        exec(compile(source, f"<popcat.aio.AsyncPopcat.{name}>", "exec"), namespace)
+        method = namespace[name]
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncPopcat.{name}"
+    method.__doc__ = f"Async version of :func:`popcat.data.{name}`."
+    return method
+
+def _make_random_method(name: str, endpoint: str):
+    """Create the async twin of a :mod:`popcat.random` function."""
+    async def method(self):
+        return await self._make_random_request(endpoint)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncPopcat.{name}"
+    method.__doc__ = f"Async version of :func:`popcat.random.{name}`."
+    return method
+
+for _name, (_endpoint, _param, _arg, _cache, _preprocess, _doc) in _DATA_ENDPOINTS.items():
+    setattr(AsyncPopcat, _name, _make_data_method(_name, _endpoint, _param, _arg, _preprocess))
+for _name, (_endpoint, _doc) in _RANDOM_ENDPOINTS.items():
+    setattr(AsyncPopcat, _name, _make_random_method(_name, _endpoint))
+del _name, _endpoint, _param, _arg, _cache, _preprocess, _doc
+
+# Alternative name for eightball, matching popcat.random._8ball
+AsyncPopcat._8ball = AsyncPopcat.eightball
+
+# Export all classes
+__all__ = ['AsyncPopcat']
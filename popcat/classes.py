@@ -9,11 +9,21 @@ Available Classes:
     - Shortener: URL shortening service with custom extensions
 """
 
-import requests
+import re
 from typing import Dict, Any, Optional, List
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._cache import TTLCache, _copy
+from ._http import BASE_URL, PopcatAPIError, get_json, post_json
+
+# Short URL extensions: alphanumeric, and 3-20 characters when creating one
+_EXTENSION_RE = re.compile(r'[A-Za-z0-9]{3,20}')
+_ALNUM_RE = re.compile(r'[A-Za-z0-9]+')
+
+# Headers for unauthenticated JSON requests
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Short URL details by extension. Click counts change, so entries only live a minute.
+_INFO_CACHE = TTLCache(maxsize=1024, ttl=60)
 
 class CodeClient:
     """
@@ -58,6 +68,10 @@ class CodeClient:
         "Elm", "ReasonML", "Crystal", "Nim", "Zig", "V", "Dlang"
     ]
     
+    # Lookup tables built once so create_bin validates with a single hash lookup
+    _THEMES_SET = frozenset(THEMES)
+    _LANG_LOOKUP = {lang.lower(): lang for lang in LANGUAGES}
+    
     def __init__(self, api_key: str):
         """
         Initialize the CodeClient with an API key.
@@ -68,9 +82,23 @@ class CodeClient:
         Raises:
             ValueError: If api_key is invalid
         """
+        self.api_key = api_key
+    
+    @property
+    def api_key(self) -> str:
+        """API key for authentication."""
+        return self._api_key
+    
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
         if not api_key or not isinstance(api_key, str):
             raise ValueError("API key must be a non-empty string")
-        self.api_key = api_key
+        self._api_key = api_key
+        # Request headers are built once per key rather than on every create_bin call
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
     
     def create_bin(self, title: str, description: str, code: str, 
                    theme: str = "GitHub Dark", language: str = "PlainText") -> Dict[str, Any]:
@@ -89,7 +117,7 @@ class CodeClient:
             
         Raises:
             ValueError: If any parameter is invalid
-            Exception: If API request fails
+            PopcatAPIError: If API request fails
             
         Example:
             >>> client = CodeClient("your-api-key")
@@ -121,35 +149,24 @@ class CodeClient:
             raise ValueError("Code must be a non-empty string")
         
         # Validate theme
-        if theme not in self.THEMES:
+        if not isinstance(theme, str) or theme not in self._THEMES_SET:
             raise ValueError(f"Theme must be one of: {', '.join(self.THEMES)}")
         
         # Validate language (case-insensitive)
         language_normalized = None
-        for lang in self.LANGUAGES:
-            if lang.lower() == language.lower():
-                language_normalized = lang
-                break
-        
+        if isinstance(language, str):
+            language_normalized = self._LANG_LOOKUP.get(language.lower())
         if language_normalized is None:
             raise ValueError(f"Language must be one of: {', '.join(self.LANGUAGES)}")
         
         # Make API request
-        try:
-            response = requests.post(f"{BASE_URL}/code", json={
-                "title": title,
-                "description": description,
-                "code": code,
-                "theme": theme,
-                "language": language_normalized
-            }, headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            })
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise Exception(f"API request failed: {str(e)}")
+        return post_json("/code", json={
+            "title": title,
+            "description": description,
+            "code": code,
+            "theme": theme,
+            "language": language_normalized
+        }, headers=self._headers)
     
     @classmethod
     def get_available_themes(cls) -> List[str]:
@@ -213,7 +230,7 @@ class Shortener:
             
         Raises:
             ValueError: If parameters are invalid
-            Exception: If API request fails
+            PopcatAPIError: If API request fails
             
         Example:
             >>> short_data = Shortener.shorten("https://example.com", "example")
@@ -230,29 +247,25 @@ class Shortener:
         # Validate URL
         if not url or not isinstance(url, str):
             raise ValueError("URL must be a non-empty string")
-        if not (url.startswith('http://') or url.startswith('https://')):
+        if not url.startswith(('http://', 'https://')):
             raise ValueError("URL must start with http:// or https://")
         
         # Validate extension
         if not extension or not isinstance(extension, str):
             raise ValueError("Extension must be a non-empty string")
-        if not extension.isalnum():
-            raise ValueError("Extension must contain only alphanumeric characters")
-        if not (3 <= len(extension) <= 20):
+        if not _EXTENSION_RE.fullmatch(extension):
+            # Only on failure, work out which rule was broken
+            if not _ALNUM_RE.fullmatch(extension):
+                raise ValueError("Extension must contain only alphanumeric characters")
             raise ValueError("Extension must be between 3 and 20 characters")
         
         # Make API request
-        try:
-            response = requests.post(f"{BASE_URL}/shorten", json={
-                "url": url,
-                "extension": extension
-            }, headers={
-                "Content-Type": "application/json"
-            })
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            raise Exception(f"API request failed: {str(e)}")
+        result = post_json("/shorten", json={
+            "url": url,
+            "extension": extension
+        }, headers=_JSON_HEADERS)
+        _INFO_CACHE.pop(extension)
+        return result
     
     @staticmethod
     def get_info(extension: str) -> Dict[str, Any]:
@@ -263,11 +276,11 @@ class Shortener:
             extension (str): Short URL extension
             
         Returns:
-            Dict[str, Any]: Information about the shortened URL
+            Dict[str, Any]: Information about the shortened URL, cached for a minute
             
         Raises:
             ValueError: If extension is invalid
-            Exception: If API request fails or URL not found
+            PopcatAPIError: If API request fails or URL not found
             
         Example:
             >>> info = Shortener.get_info("example")
@@ -282,21 +295,44 @@ class Shortener:
                 ...
             }
         """
+        # Only validated extensions are cached, so a hit needs no further checks
+        if isinstance(extension, str):
+            info = _INFO_CACHE.get(extension)
+            if info is not None:
+                return _copy(info)
+        
         # Validate extension
         if not extension or not isinstance(extension, str):
             raise ValueError("Extension must be a non-empty string")
-        if not extension.isalnum():
+        if not _ALNUM_RE.fullmatch(extension):
             raise ValueError("Extension must contain only alphanumeric characters")
         
         # Make API request
         try:
-            response = requests.get(f"{BASE_URL}/shorten/{extension}")
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            if hasattr(e.response, 'status_code') and e.response.status_code == 404:
-                raise Exception(f"Shortened URL with extension '{extension}' not found")
-            raise Exception(f"API request failed: {str(e)}")
+            info = get_json(f"/shorten/{extension}")
+        except PopcatAPIError as e:
+            if e.status == 404:
+                raise PopcatAPIError(f"Shortened URL with extension '{extension}' not found",
+                                     status=404, endpoint=e.endpoint) from e.__cause__
+            raise
+        _INFO_CACHE[extension] = info
+        return _copy(info)
+    
+    @staticmethod
+    def invalidate(extension: str) -> None:
+        """
+        Drop the cached details of a shortened URL.
+        
+        :meth:`get_info` keeps results for a minute; call this to force the next
+        lookup to hit the API.
+        
+        Args:
+            extension (str): Short URL extension
+            
+        Example:
+            >>> Shortener.invalidate("example")
+        """
+        _INFO_CACHE.pop(extension)
 
 # Export all classes
 __all__ = ['CodeClient', 'Shortener']
\ No newline at end of file
@@ -3,6 +3,9 @@ Data & Information APIs Module
 
 This module provides functions for retrieving real-world data and information.
 All functions return structured dictionaries with comprehensive information.
+Text arguments must be non-empty ``str`` instances. Lookups are cached in
+memory; ``randomcolor`` is not, since every call should differ. Pass
+``use_cache=False`` to skip the cache.
 
 Available Functions:
     - weather(place): Get current weather information for any location
@@ -18,40 +21,35 @@ Available Functions:
     - itunes(song): Search for songs on iTunes
 """
 
-import requests
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional
 from urllib.parse import quote
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._cache import TTLCache, cached
+from ._http import BASE_URL, get_json_url as _make_request, url_for
 
-def _validate_text(text: str) -> None:
-    """Validate that the provided text is valid."""
-    if not text or not isinstance(text, str):
-        raise ValueError("Text must be a non-empty string")
+# Reference data that does not change, kept until evicted
+_STATIC_CACHE = TTLCache(maxsize=512)
 
-def _make_request(endpoint: str, params: dict = None) -> Dict[str, Any]:
-    """Make a request to the API and return JSON data."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params or {})
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
+# Live data such as weather or follower counts, kept for five minutes
+_LOOKUP_CACHE = TTLCache(maxsize=512, ttl=300)
 
-def weather(place: str) -> Dict[str, Any]:
-    """
+# Endpoints taking at most one text argument, shared with the async client:
+# function name -> (endpoint, query parameter, argument name, cache, preprocess, docstring).
+# preprocess, when set, normalizes the validated argument before it is sent.
+_ENDPOINTS = {
+    "weather": ("/weather", "q", "place", _LOOKUP_CACHE, None, """
     Get current weather information for any location.
     
     Args:
         place (str): City or location name
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Weather data including temperature, conditions, humidity, etc.
         
     Raises:
         ValueError: If place name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> weather_data = weather("London")
@@ -64,23 +62,20 @@ def weather(place: str) -> Dict[str, Any]:
             'wind': '10 km/h',
             ...
         }
-    """
-    _validate_text(place)
-    return _make_request("/weather", {"q": place})
-
-def github(username: str) -> Dict[str, Any]:
-    """
+    """),
+    "github": ("/github", "user", "username", _LOOKUP_CACHE, None, """
     Get GitHub user information and statistics.
     
     Args:
         username (str): GitHub username
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: User profile data, repos, stats, followers, etc.
         
     Raises:
         ValueError: If username is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> user_data = github("octocat")
@@ -94,23 +89,20 @@ def github(username: str) -> Dict[str, Any]:
             'following': 9,
             ...
         }
-    """
-    _validate_text(username)
-    return _make_request("/github", {"user": username})
-
-def npm(package: str) -> Dict[str, Any]:
-    """
+    """),
+    "npm": ("/npm", "q", "package", _LOOKUP_CACHE, None, """
     Get NPM package details and statistics.
     
     Args:
         package (str): NPM package name
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Package information, downloads, version, dependencies
         
     Raises:
         ValueError: If package name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> package_data = npm("express")
@@ -123,23 +115,20 @@ def npm(package: str) -> Dict[str, Any]:
             'author': 'TJ Holowaychuk',
             ...
         }
-    """
-    _validate_text(package)
-    return _make_request("/npm", {"q": package})
-
-def steam(name: str) -> Dict[str, Any]:
-    """
+    """),
+    "steam": ("/steam", "q", "name", _LOOKUP_CACHE, None, """
     Search for games on Steam platform.
     
     Args:
         name (str): Game name to search
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Game information, price, reviews, screenshots
         
     Raises:
         ValueError: If game name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> game_data = steam("Portal 2")
@@ -152,23 +141,20 @@ def steam(name: str) -> Dict[str, Any]:
             'developer': 'Valve',
             ...
         }
-    """
-    _validate_text(name)
-    return _make_request("/steam", {"q": name})
-
-def imdb(name: str) -> Dict[str, Any]:
-    """
+    """),
+    "imdb": ("/imdb", "q", "name", _LOOKUP_CACHE, None, """
     Search for movies and TV shows on IMDB.
     
     Args:
         name (str): Movie/TV show name
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Movie/show details, ratings, cast, plot
         
     Raises:
         ValueError: If movie/show name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> movie_data = imdb("The Matrix")
@@ -182,23 +168,20 @@ def imdb(name: str) -> Dict[str, Any]:
             'cast': ['Keanu Reeves', 'Laurence Fishburne', ...],
             ...
         }
-    """
-    _validate_text(name)
-    return _make_request("/imdb", {"q": name})
-
-def country(name: str) -> Dict[str, Any]:
-    """
+    """),
+    "country": ("/country", "name", "name", _STATIC_CACHE, None, """
     Get detailed information about any country.
     
     Args:
         name (str): Country name
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
         
     Returns:
         Dict[str, Any]: Country data, population, capital, currency, flag, etc.
         
     Raises:
         ValueError: If country name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> country_data = country("Japan")
@@ -212,23 +195,20 @@ def country(name: str) -> Dict[str, Any]:
             'continent': 'Asia',
             ...
         }
-    """
-    _validate_text(name)
-    return _make_request("/country", {"name": name})
-
-def periodic_table(element: str) -> Dict[str, Any]:
-    """
+    """),
+    "periodic_table": ("/periodic_table", "element", "element", _STATIC_CACHE, None, """
     Get periodic table element information.
     
     Args:
         element (str): Element name or symbol (e.g., "Hydrogen" or "H")
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
         
     Returns:
         Dict[str, Any]: Element properties, atomic data, discovery info
         
     Raises:
         ValueError: If element name/symbol is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> element_data = periodic_table("Carbon")
@@ -243,23 +223,20 @@ def periodic_table(element: str) -> Dict[str, Any]:
             'category': 'Nonmetal',
             ...
         }
-    """
-    _validate_text(element)
-    return _make_request("/periodic_table", {"element": element})
-
-def colorinfo(color: str) -> Dict[str, Any]:
-    """
+    """),
+    "colorinfo": ("/colorinfo", "color", "color", _STATIC_CACHE, None, """
     Get detailed information about any color.
     
     Args:
         color (str): Hex color code (e.g., "#FF0000") or color name (e.g., "red")
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
         
     Returns:
         Dict[str, Any]: Color data, RGB, HSL, CMYK values, name
         
     Raises:
         ValueError: If color format is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> color_data = colorinfo("#FF0000")
@@ -272,19 +249,15 @@ def colorinfo(color: str) -> Dict[str, Any]:
             'name': 'Red',
             ...
         }
-    """
-    _validate_text(color)
-    return _make_request("/colorinfo", {"color": color})
-
-def randomcolor() -> Dict[str, Any]:
-    """
+    """),
+    "randomcolor": ("/randomcolor", None, None, None, None, """
     Generate a random color with all formats.
     
     Returns:
         Dict[str, Any]: Random color with hex, RGB, HSL values, and name
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> random_color = randomcolor()
@@ -296,22 +269,21 @@ def randomcolor() -> Dict[str, Any]:
             'name': 'Steel Blue',
             ...
         }
-    """
-    return _make_request("/randomcolor")
-
-def subreddit(subreddit_name: str) -> Dict[str, Any]:
-    """
+    """),
+    "subreddit": ("/subreddit", "subreddit", "subreddit_name", _LOOKUP_CACHE,
+                  lambda name: name.removeprefix('r/'), """
     Get Reddit subreddit information.
     
     Args:
-        subreddit_name (str): Subreddit name (without r/ prefix)
+        subreddit_name (str): Subreddit name (an r/ prefix is removed)
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Subreddit statistics and information
         
     Raises:
         ValueError: If subreddit name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> subreddit_data = subreddit("python")
@@ -325,26 +297,20 @@ def subreddit(subreddit_name: str) -> Dict[str, Any]:
             'is_nsfw': False,
             ...
         }
-    """
-    _validate_text(subreddit_name)
-    # Remove r/ prefix if present
-    if subreddit_name.startswith('r/'):
-        subreddit_name = subreddit_name[2:]
-    return _make_request("/subreddit", {"subreddit": subreddit_name})
-
-def itunes(song: str) -> Dict[str, Any]:
-    """
+    """),
+    "itunes": ("/itunes", "q", "song", _LOOKUP_CACHE, None, """
     Search for songs on iTunes.
     
     Args:
         song (str): Song name to search
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Song details, artist, album, preview, artwork
         
     Raises:
         ValueError: If song name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> song_data = itunes("Bohemian Rhapsody")
@@ -359,9 +325,52 @@ def itunes(song: str) -> Dict[str, Any]:
             'artwork': 'https://...',
             ...
         }
-    """
-    _validate_text(song)
-    return _make_request("/itunes", {"q": song})
+    """),
+}
+
+# Source templates for the generated endpoint functions. The URL and query parameter
+# are baked in as literals; the argument is quoted onto the URL directly, so no
+# params dict is built and the HTTP client has no query string to encode.
+_NO_ARG_TEMPLATE = """
+def {name}() -> Dict[str, Any]:
+    return _make_request({url!r})
+"""
+
+_ONE_ARG_TEMPLATE = """
+def {name}({arg}: str, use_cache: bool = True) -> Dict[str, Any]:
+    if type({arg}) is not str or not {arg}:
+        raise ValueError("Text must be a non-empty string"){preprocess}
+    url = {prefix!r} + quote({arg}, safe='')
+    if use_cache:
+        return cached_request(url)
+    return _make_request(url)
+"""
+
+def _make_endpoint(name: str, endpoint: str, param: Optional[str], arg: Optional[str],
+                   cache: Optional[TTLCache], preprocess: Optional[Callable[[str], str]], doc: str):
+    """Generate an endpoint function taking at most one text argument named ``arg``."""
+    url = url_for(endpoint)
+    namespace = {'__name__': __name__, 'Dict': Dict, 'Any': Any, '_make_request': _make_request}
+    if param is None:
+        source = _NO_ARG_TEMPLATE.format(name=name, url=url)
+    else:
+        # Only exact str is accepted; the type check is a pointer comparison
+        # rather than an MRO walk
+        namespace['cached_request'] = cached(cache)(_make_request)
+        namespace['preprocess'] = preprocess
+        namespace['quote'] = quote
+        source = _ONE_ARG_TEMPLATE.format(
+            name=name, arg=arg, prefix=f"{url}?{param}=",
+            preprocess=f"\n    {arg} = preprocess({arg})" if preprocess is not None else "",
+        )
+    exec(compile(source, f"<popcat.data.{name}>", "exec"), namespace)
+    func = namespace[name]
+    func.__doc__ = doc
+    return func
+
+for _name, _spec in _ENDPOINTS.items():
+    globals()[_name] = _make_endpoint(_name, *_spec)
+del _name, _spec
 
 # Export all functions
 __all__ = [
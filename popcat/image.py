@@ -2,7 +2,8 @@
 Image Manipulation Module
 
 This module provides functions for applying various filters and effects to images.
-All functions return image URLs as strings.
+All functions return image URLs as strings. The URLs are built locally without
+contacting the API; pass ``verify=True`` to confirm the image with a HEAD request.
 
 Available Functions:
     - jail(image_url): Apply jail filter overlay to an image
@@ -21,175 +22,115 @@ Available Functions:
     - mnm(image): Generate M&M-style meme with the image
 """
 
-import requests
 from typing import Optional
 from urllib.parse import quote
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._http import BASE_URL, build_url, verified_url
+from ._validate import _validate_image_url
 
-def _validate_image_url(image_url: str) -> None:
-    """Validate that the provided string is a valid image URL."""
-    if not image_url or not isinstance(image_url, str):
-        raise ValueError("Image URL must be a non-empty string")
-    if not (image_url.startswith('http://') or image_url.startswith('https://')):
-        raise ValueError("Image URL must start with http:// or https://")
+def _make_request(endpoint: str, params: dict, verify: bool = False) -> str:
+    """Return the image URL, optionally confirming it with a HEAD request."""
+    if verify:
+        return verified_url(endpoint, params)  # Return the final URL which points to the generated image
+    return build_url(endpoint, params)
 
-def _make_request(endpoint: str, params: dict) -> str:
-    """Make a request to the API and return the image URL."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.url  # Return the final URL which points to the generated image
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-def jail(image_url: str) -> str:
-    """
-    Apply jail filter overlay to an image.
-    
-    Args:
-        image_url (str): URL of the image to process
-        
-    Returns:
-        str: URL of the processed image with jail overlay
-        
-    Raises:
-        ValueError: If image_url is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> jail_image = jail("https://example.com/image.png")
-        >>> print(jail_image)
-        https://api.popcat.xyz/jail?image=...
-    """
-    _validate_image_url(image_url)
-    return _make_request("/jail", {"image": image_url})
-
-def blur(image: str) -> str:
-    """
-    Apply blur filter to an image.
-    
-    Args:
-        image (str): URL of the image to blur
-        
-    Returns:
-        str: URL of the blurred image
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> blurred = blur("https://example.com/photo.jpg")
-        >>> print(blurred)
-        https://api.popcat.xyz/blur?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/blur", {"image": image})
-
-def invert(image: str) -> str:
-    """
-    Invert all colors in the image.
-    
-    Args:
-        image (str): URL of the image to invert
-        
-    Returns:
-        str: URL of the inverted image
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> inverted = invert("https://example.com/image.png")
-        >>> print(inverted)
-        https://api.popcat.xyz/invert?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/invert", {"image": image})
-
-def greyscale(image: str) -> str:
-    """
-    Convert image to greyscale/black and white.
-    
-    Args:
-        image (str): URL of the image to convert
-        
-    Returns:
-        str: URL of the greyscale image
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> grey_image = greyscale("https://example.com/colorful.jpg")
-        >>> print(grey_image)
-        https://api.popcat.xyz/greyscale?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/greyscale", {"image": image})
-
-def drip(image: str) -> str:
-    """
-    Apply drip effect filter to an image.
-    
-    Args:
-        image (str): URL of the image
-        
-    Returns:
-        str: URL of the processed image with drip effect
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> drip_image = drip("https://example.com/image.png")
-        >>> print(drip_image)
-        https://api.popcat.xyz/drip?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/drip", {"image": image})
-
-def clown(image: str) -> str:
-    """
-    Apply clown makeup filter to an image.
+# Docstring template shared by the generated endpoint functions
+_DOCSTRING = """
+    {summary}
     
     Args:
-        image (str): URL of the image
+        {arg} (str): {arg_doc}
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
-        str: URL of the processed image with clown makeup
+        str: {returns}
         
     Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
+        ValueError: If {invalid} is invalid
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
-        >>> clown_image = clown("https://example.com/face.jpg")
-        >>> print(clown_image)
-        https://api.popcat.xyz/clown?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/clown", {"image": image})
-
-def colorify(image: str, color: str) -> str:
+        >>> {var} = {name}("{example}")
+        >>> print({var})
+        https://api.popcat.xyz/{name}?image=...
+    """
+
+def _make_image_endpoint(name: str, arg: str, summary: str, arg_doc: str, returns: str, example: str):
+    """Create an endpoint function taking a single image URL argument named ``arg``."""
+    endpoint = f"/{name}"
+
+    # Validation is inlined (same checks as _validate_image_url) to skip a call per request
+    if arg == "image_url":
+        def func(image_url: str, verify: bool = False) -> str:
+            if not image_url or not isinstance(image_url, str):
+                raise ValueError("Image URL must be a non-empty string")
+            if not image_url.startswith(('http://', 'https://')):
+                raise ValueError("Image URL must start with http:// or https://")
+            return _make_request(endpoint, {"image": image_url}, verify=verify)
+    else:
+        def func(image: str, verify: bool = False) -> str:
+            if not image or not isinstance(image, str):
+                raise ValueError("Image URL must be a non-empty string")
+            if not image.startswith(('http://', 'https://')):
+                raise ValueError("Image URL must start with http:// or https://")
+            return _make_request(endpoint, {"image": image}, verify=verify)
+
+    func.__name__ = func.__qualname__ = name
+    func.__doc__ = _DOCSTRING.format(
+        summary=summary, arg=arg, arg_doc=arg_doc, returns=returns,
+        invalid="image_url" if arg == "image_url" else "image URL",
+        var=f"{name}_image", name=name, example=example,
+    )
+    return func
+
+# Endpoints taking a single image URL: (name, argument name, summary, argument description,
+# return description, example)
+_IMAGE_ENDPOINTS = (
+    ("jail", "image_url", "Apply jail filter overlay to an image.", "URL of the image to process",
+     "URL of the processed image with jail overlay", "https://example.com/image.png"),
+    ("blur", "image", "Apply blur filter to an image.", "URL of the image to blur",
+     "URL of the blurred image", "https://example.com/photo.jpg"),
+    ("invert", "image", "Invert all colors in the image.", "URL of the image to invert",
+     "URL of the inverted image", "https://example.com/image.png"),
+    ("greyscale", "image", "Convert image to greyscale/black and white.", "URL of the image to convert",
+     "URL of the greyscale image", "https://example.com/colorful.jpg"),
+    ("drip", "image", "Apply drip effect filter to an image.", "URL of the image",
+     "URL of the processed image with drip effect", "https://example.com/image.png"),
+    ("clown", "image", "Apply clown makeup filter to an image.", "URL of the image",
+     "URL of the processed image with clown makeup", "https://example.com/face.jpg"),
+    ("wanted", "image", 'Generate a "WANTED" poster with the provided image.', "URL of the image for the poster",
+     "URL of the wanted poster", "https://example.com/criminal.jpg"),
+    ("ad", "image", "Generate advertisement-style meme.", "URL of the image",
+     "URL of the ad meme", "https://example.com/product.jpg"),
+    ("uncover", "image", "Apply uncover filter effect.", "URL of the image",
+     "URL of the processed image", "https://example.com/hidden.jpg"),
+    ("communism", "image_url", "Apply communism filter with red overlay and symbols.", "URL of the image",
+     "URL of the processed image with communism filter", "https://example.com/image.png"),
+    ("jokeoverhead", "image", 'Generate "joke over head" meme format.', "URL of the image",
+     "URL of the joke over head meme", "https://example.com/confused.jpg"),
+    ("mnm", "image", "Generate M&M-style meme with the image.", "URL of the image",
+     "URL of the M&M meme", "https://example.com/face.jpg"),
+)
+
+for _spec in _IMAGE_ENDPOINTS:
+    globals()[_spec[0]] = _make_image_endpoint(*_spec)
+del _spec
+
+def colorify(image: str, color: str, verify: bool = False) -> str:
     """
     Apply color filter/tint to an image.
     
     Args:
         image (str): URL of the image
         color (str): Color to apply (hex code like #FF0000 or color name like red)
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
         str: URL of the colorized image
         
     Raises:
         ValueError: If image URL or color is invalid
-        Exception: If API request fails
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
         >>> red_tinted = colorify("https://example.com/image.png", "#FF0000")
@@ -201,44 +142,23 @@ def colorify(image: str, color: str) -> str:
     if not color or not isinstance(color, str):
         raise ValueError("Color must be a non-empty string")
     
-    return _make_request("/colorify", {"image": image, "color": color})
-
-def wanted(image: str) -> str:
-    """
-    Generate a "WANTED" poster with the provided image.
-    
-    Args:
-        image (str): URL of the image for the poster
-        
-    Returns:
-        str: URL of the wanted poster
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> poster = wanted("https://example.com/criminal.jpg")
-        >>> print(poster)
-        https://api.popcat.xyz/wanted?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/wanted", {"image": image})
+    return _make_request("/colorify", {"image": image, "color": color}, verify=verify)
 
-def gun(image: str, text: Optional[str] = None) -> str:
+def gun(image: str, text: Optional[str] = None, verify: bool = False) -> str:
     """
     Generate gun meme with image.
     
     Args:
         image (str): URL of the image
         text (str, optional): Text to add to the meme
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
         str: URL of the generated gun meme
         
     Raises:
         ValueError: If image URL is invalid
-        Exception: If API request fails
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
         >>> gun_meme = gun("https://example.com/person.jpg")
@@ -250,117 +170,7 @@ def gun(image: str, text: Optional[str] = None) -> str:
     params = {"image": image}
     if text:
         params["text"] = text
-    return _make_request("/gun", params)
-
-def ad(image: str) -> str:
-    """
-    Generate advertisement-style meme.
-    
-    Args:
-        image (str): URL of the image
-        
-    Returns:
-        str: URL of the ad meme
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> ad_meme = ad("https://example.com/product.jpg")
-        >>> print(ad_meme)
-        https://api.popcat.xyz/ad?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/ad", {"image": image})
-
-def uncover(image: str) -> str:
-    """
-    Apply uncover filter effect.
-    
-    Args:
-        image (str): URL of the image
-        
-    Returns:
-        str: URL of the processed image
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> uncovered = uncover("https://example.com/hidden.jpg")
-        >>> print(uncovered)
-        https://api.popcat.xyz/uncover?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/uncover", {"image": image})
-
-def communism(image_url: str) -> str:
-    """
-    Apply communism filter with red overlay and symbols.
-    
-    Args:
-        image_url (str): URL of the image
-        
-    Returns:
-        str: URL of the processed image with communism filter
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> communist_image = communism("https://example.com/image.png")
-        >>> print(communist_image)
-        https://api.popcat.xyz/communism?image=...
-    """
-    _validate_image_url(image_url)
-    return _make_request("/communism", {"image": image_url})
-
-def jokeoverhead(image: str) -> str:
-    """
-    Generate "joke over head" meme format.
-    
-    Args:
-        image (str): URL of the image
-        
-    Returns:
-        str: URL of the joke over head meme
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> overhead_meme = jokeoverhead("https://example.com/confused.jpg")
-        >>> print(overhead_meme)
-        https://api.popcat.xyz/jokeoverhead?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/jokeoverhead", {"image": image})
-
-def mnm(image: str) -> str:
-    """
-    Generate M&M-style meme with the image.
-    
-    Args:
-        image (str): URL of the image
-        
-    Returns:
-        str: URL of the M&M meme
-        
-    Raises:
-        ValueError: If image URL is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> mnm_meme = mnm("https://example.com/face.jpg")
-        >>> print(mnm_meme)
-        https://api.popcat.xyz/mnm?image=...
-    """
-    _validate_image_url(image)
-    return _make_request("/mnm", {"image": image})
+    return _make_request("/gun", params, verify=verify)
 
 # Export all functions
 __all__ = [
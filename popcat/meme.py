@@ -2,7 +2,8 @@
 Meme Generation Module
 
 This module provides functions for creating popular meme formats with custom text and images.
-Most functions return image URLs as strings.
+Most functions return image URLs as strings. The URLs are built locally without
+contacting the API; pass ``verify=True`` to confirm the image with a HEAD request.
 
 Available Functions:
     - drake(text1, text2): Generate Drake pointing meme format
@@ -25,107 +26,138 @@ Available Functions:
     - caution(text): Generate caution warning sign
 """
 
-import requests
 from typing import Optional, Dict, Any
 from urllib.parse import quote
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._cache import RESPONSE_CACHE, cached
+from ._http import BASE_URL, build_url, get_json, verified_url
+from ._validate import _validate_text, _validate_image_url
 
-def _validate_text(text: str, max_length: Optional[int] = None) -> None:
-    """Validate that the provided text is valid."""
-    if not text or not isinstance(text, str):
-        raise ValueError("Text must be a non-empty string")
-    if max_length and len(text) > max_length:
-        raise ValueError(f"Text must be {max_length} characters or less")
+def _make_request(endpoint: str, params: dict, verify: bool = False) -> str:
+    """Return the image URL, optionally confirming it with a HEAD request."""
+    if verify:
+        return verified_url(endpoint, params)
+    return build_url(endpoint, params)
 
-def _validate_image_url(image_url: str) -> None:
-    """Validate that the provided string is a valid image URL."""
-    if not image_url or not isinstance(image_url, str):
-        raise ValueError("Image URL must be a non-empty string")
-    if not (image_url.startswith('http://') or image_url.startswith('https://')):
-        raise ValueError("Image URL must start with http:// or https://")
+# JSON endpoints of this module are deterministic, so their responses are cached
+_make_json_request = cached(RESPONSE_CACHE)(get_json)
 
-def _make_request(endpoint: str, params: dict) -> str:
-    """Make a request to the API and return the image URL."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.url
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-def _make_json_request(endpoint: str, params: dict) -> Dict[str, Any]:
-    """Make a request to the API and return JSON data."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-def drake(text1: str, text2: str) -> str:
-    """
-    Generate Drake pointing meme format.
+# Docstring template shared by the generated endpoint functions
+_DOCSTRING = """
+    {summary}
     
     Args:
-        text1 (str): Text for the "rejection" panel (Drake looking away)
-        text2 (str): Text for the "approval" panel (Drake pointing)
+{args}
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
-        str: URL of the Drake meme
+        str: {returns}
         
     Raises:
-        ValueError: If text parameters are invalid
-        Exception: If API request fails
+        ValueError: If {invalid} invalid
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
-        >>> drake_meme = drake("Using other APIs", "Using Popcat API")
-        >>> print(drake_meme)
-        https://api.popcat.xyz/drake?text1=...&text2=...
+        >>> {var} = {name}({example})
+        >>> print({var})
+        https://api.popcat.xyz/{name}?{query}
     """
-    _validate_text(text1)
-    _validate_text(text2)
-    return _make_request("/drake", {"text1": text1, "text2": text2})
 
-def pooh(text1: str, text2: str) -> str:
-    """
-    Generate Winnie the Pooh meme format.
-    
-    Args:
-        text1 (str): Text for regular Pooh (normal behavior)
-        text2 (str): Text for fancy Pooh (sophisticated behavior)
-        
-    Returns:
-        str: URL of the Pooh meme
-        
-    Raises:
-        ValueError: If text parameters are invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> pooh_meme = pooh("Eating honey", "Consuming apiary nectar")
-        >>> print(pooh_meme)
-        https://api.popcat.xyz/pooh?text1=...&text2=...
-    """
-    _validate_text(text1)
-    _validate_text(text2)
-    return _make_request("/pooh", {"text1": text1, "text2": text2})
+def _finish_endpoint(func, name: str, doc: str):
+    """Give a generated endpoint function its public name and docstring."""
+    func.__name__ = func.__qualname__ = name
+    func.__doc__ = doc
+    return func
+
+def _make_text_endpoint(name: str, summary: str, text_doc: str, returns: str, example: str):
+    """Create an endpoint function taking a single ``text`` argument."""
+    endpoint = f"/{name}"
+
+    # Validation is inlined (same check as _validate_text) to skip a call per request
+    def func(text: str, verify: bool = False) -> str:
+        if not text or not isinstance(text, str):
+            raise ValueError("Text must be a non-empty string")
+        return _make_request(endpoint, {"text": text}, verify=verify)
+
+    return _finish_endpoint(func, name, _DOCSTRING.format(
+        summary=summary, args=f"        text (str): {text_doc}", returns=returns,
+        invalid="text is", var=f"{name}_meme", name=name, example=f'"{example}"', query="text=...",
+    ))
+
+def _make_dual_text_endpoint(name: str, summary: str, text_docs: tuple, returns: str, examples: tuple):
+    """Create an endpoint function taking ``text1`` and ``text2`` arguments."""
+    endpoint = f"/{name}"
+
+    # Validation is inlined (same check as _validate_text) to skip two calls per request
+    def func(text1: str, text2: str, verify: bool = False) -> str:
+        if not text1 or not isinstance(text1, str) or not text2 or not isinstance(text2, str):
+            raise ValueError("Text must be a non-empty string")
+        return _make_request(endpoint, {"text1": text1, "text2": text2}, verify=verify)
+
+    return _finish_endpoint(func, name, _DOCSTRING.format(
+        summary=summary, args=f"        text1 (str): {text_docs[0]}\n        text2 (str): {text_docs[1]}",
+        returns=returns, invalid="text parameters are", var=f"{name}_meme", name=name,
+        example=", ".join(f'"{example}"' for example in examples), query="text1=...&text2=...",
+    ))
+
+# Endpoints taking a single text argument: (name, summary, text description, return description, example)
+_TEXT_ENDPOINTS = (
+    ("supreme", "Generate Supreme-style logo with custom text.", "Custom text for the logo",
+     "URL of the Supreme logo image", "POPCAT"),
+    ("oogway", "Generate Master Oogway wisdom quote meme.", "Quote text",
+     "URL of the Oogway meme", "There are no accidents"),
+    ("biden", "Generate Biden tweet-style meme.", "Tweet content",
+     "URL of the Biden tweet meme", "Listen, Jack..."),
+    ("pikachu", "Generate surprised Pikachu meme.", "Text for the meme",
+     "URL of the Pikachu meme", "When you realize it's Monday"),
+    ("sadcat", "Generate sad cat meme with custom text.", "Text for the sad cat",
+     "URL of the sad cat meme", "No more treats"),
+    ("unforgivable", 'Generate "unforgivable" curse meme.', "Text for the meme",
+     "URL of the unforgivable meme", "Using Internet Explorer"),
+    ("couldread", 'Generate "could you please read" meme.', "Text for the meme",
+     "URL of the meme", "the documentation"),
+    ("facts", 'Generate "facts" meme with custom text.', "Fact text",
+     "URL of the facts meme", "Python is awesome"),
+    ("alert", "Generate warning alert sign.", "Alert message",
+     "URL of the alert sign", "DANGER: High Voltage"),
+    ("caution", "Generate caution warning sign.", "Caution message",
+     "URL of the caution sign", "Wet Floor"),
+)
+
+# Endpoints taking two text arguments: (name, summary, text descriptions, return description, examples)
+_DUAL_TEXT_ENDPOINTS = (
+    ("drake", "Generate Drake pointing meme format.",
+     ('Text for the "rejection" panel (Drake looking away)', 'Text for the "approval" panel (Drake pointing)'),
+     "URL of the Drake meme", ("Using other APIs", "Using Popcat API")),
+    ("pooh", "Generate Winnie the Pooh meme format.",
+     ("Text for regular Pooh (normal behavior)", "Text for fancy Pooh (sophisticated behavior)"),
+     "URL of the Pooh meme", ("Eating honey", "Consuming apiary nectar")),
+    ("happysad", "Generate happy vs sad comparison meme.",
+     ("Text for happy side", "Text for sad side"),
+     "URL of the happy/sad meme", ("Friday", "Monday")),
+)
 
-def ship(image1: str, image2: str) -> str:
+for _spec in _TEXT_ENDPOINTS:
+    globals()[_spec[0]] = _make_text_endpoint(*_spec)
+for _spec in _DUAL_TEXT_ENDPOINTS:
+    globals()[_spec[0]] = _make_dual_text_endpoint(*_spec)
+del _spec
+
+def ship(image1: str, image2: str, verify: bool = False) -> str:
     """
     Generate ship compatibility meme with percentage.
     
     Args:
         image1 (str): URL of first person's image
         image2 (str): URL of second person's image
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
         str: URL of the ship compatibility meme
         
     Raises:
         ValueError: If image URLs are invalid
-        Exception: If API request fails
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
         >>> ship_meme = ship("https://example.com/person1.jpg", "https://example.com/person2.jpg")
@@ -134,132 +166,23 @@ def ship(image1: str, image2: str) -> str:
     """
     _validate_image_url(image1)
     _validate_image_url(image2)
-    return _make_request("/ship", {"user1": image1, "user2": image2})
-
-def supreme(text: str) -> str:
-    """
-    Generate Supreme-style logo with custom text.
-    
-    Args:
-        text (str): Custom text for the logo
-        
-    Returns:
-        str: URL of the Supreme logo image
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> supreme_logo = supreme("POPCAT")
-        >>> print(supreme_logo)
-        https://api.popcat.xyz/supreme?text=POPCAT
-    """
-    _validate_text(text)
-    return _make_request("/supreme", {"text": text})
-
-def oogway(text: str) -> str:
-    """
-    Generate Master Oogway wisdom quote meme.
-    
-    Args:
-        text (str): Quote text
-        
-    Returns:
-        str: URL of the Oogway meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> wisdom = oogway("There are no accidents")
-        >>> print(wisdom)
-        https://api.popcat.xyz/oogway?text=...
-    """
-    _validate_text(text)
-    return _make_request("/oogway", {"text": text})
-
-def biden(text: str) -> str:
-    """
-    Generate Biden tweet-style meme.
-    
-    Args:
-        text (str): Tweet content
-        
-    Returns:
-        str: URL of the Biden tweet meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> biden_tweet = biden("Listen, Jack...")
-        >>> print(biden_tweet)
-        https://api.popcat.xyz/biden?text=...
-    """
-    _validate_text(text)
-    return _make_request("/biden", {"text": text})
-
-def pikachu(text: str) -> str:
-    """
-    Generate surprised Pikachu meme.
-    
-    Args:
-        text (str): Text for the meme
-        
-    Returns:
-        str: URL of the Pikachu meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> pikachu_meme = pikachu("When you realize it's Monday")
-        >>> print(pikachu_meme)
-        https://api.popcat.xyz/pikachu?text=...
-    """
-    _validate_text(text)
-    return _make_request("/pikachu", {"text": text})
-
-def sadcat(text: str) -> str:
-    """
-    Generate sad cat meme with custom text.
-    
-    Args:
-        text (str): Text for the sad cat
-        
-    Returns:
-        str: URL of the sad cat meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> sad_meme = sadcat("No more treats")
-        >>> print(sad_meme)
-        https://api.popcat.xyz/sadcat?text=...
-    """
-    _validate_text(text)
-    return _make_request("/sadcat", {"text": text})
+    return _make_request("/ship", {"user1": image1, "user2": image2}, verify=verify)
 
-def opinion(image: str, text: str) -> str:
+def opinion(image: str, text: str, verify: bool = False) -> str:
     """
     Generate "opinion" meme format.
     
     Args:
         image (str): URL of the person's image
         text (str): Opinion text
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
         str: URL of the opinion meme
         
     Raises:
         ValueError: If image URL or text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
         >>> opinion_meme = opinion("https://example.com/person.jpg", "Pineapple belongs on pizza")
@@ -268,10 +191,11 @@ def opinion(image: str, text: str) -> str:
     """
     _validate_image_url(image)
     _validate_text(text)
-    return _make_request("/opinion", {"image": image, "text": text})
+    return _make_request("/opinion", {"image": image, "text": text}, verify=verify)
 
 def discord_message(username: str, content: str, avatar: Optional[str] = None, 
-                   color: Optional[str] = None, timestamp: Optional[str] = None) -> str:
+                   color: Optional[str] = None, timestamp: Optional[str] = None,
+                   verify: bool = False) -> str:
     """
     Generate Discord message screenshot.
     
@@ -281,13 +205,14 @@ def discord_message(username: str, content: str, avatar: Optional[str] = None,
         avatar (str, optional): Avatar image URL
         color (str, optional): User role color (hex code)
         timestamp (str, optional): Message timestamp
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
         str: URL of the Discord message image
         
     Raises:
         ValueError: If required parameters are invalid
-        Exception: If API request fails
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
         >>> discord_msg = discord_message("CoolUser", "Hello everyone!")
@@ -309,9 +234,9 @@ def discord_message(username: str, content: str, avatar: Optional[str] = None,
     if timestamp:
         params["timestamp"] = timestamp
         
-    return _make_request("/discord", params)
+    return _make_request("/discord", params, verify=verify)
 
-def quote(image: str, text: str, name: str) -> str:
+def quote(image: str, text: str, name: str, verify: bool = False) -> str:
     """
     Generate inspirational quote image.
     
@@ -319,13 +244,14 @@ def quote(image: str, text: str, name: str) -> str:
         image (str): URL of the person's image
         text (str): Quote text (1-125 characters)
         name (str): Name of the person
+        verify (bool, optional): Confirm the image exists with a HEAD request. Defaults to False
         
     Returns:
         str: URL of the quote image
         
     Raises:
         ValueError: If parameters are invalid
-        Exception: If API request fails
+        PopcatAPIError: If verify is set and the API request fails
         
     Example:
         >>> quote_img = quote("https://example.com/einstein.jpg", 
@@ -338,75 +264,7 @@ def quote(image: str, text: str, name: str) -> str:
     _validate_text(text, max_length=125)
     _validate_text(name)
     
-    return _make_request("/quote", {"image": image, "text": text, "name": name})
-
-def happysad(text1: str, text2: str) -> str:
-    """
-    Generate happy vs sad comparison meme.
-    
-    Args:
-        text1 (str): Text for happy side
-        text2 (str): Text for sad side
-        
-    Returns:
-        str: URL of the happy/sad meme
-        
-    Raises:
-        ValueError: If text parameters are invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> happysad_meme = happysad("Friday", "Monday")
-        >>> print(happysad_meme)
-        https://api.popcat.xyz/happysad?text1=...&text2=...
-    """
-    _validate_text(text1)
-    _validate_text(text2)
-    return _make_request("/happysad", {"text1": text1, "text2": text2})
-
-def unforgivable(text: str) -> str:
-    """
-    Generate "unforgivable" curse meme.
-    
-    Args:
-        text (str): Text for the meme
-        
-    Returns:
-        str: URL of the unforgivable meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> unforgivable_meme = unforgivable("Using Internet Explorer")
-        >>> print(unforgivable_meme)
-        https://api.popcat.xyz/unforgivable?text=...
-    """
-    _validate_text(text)
-    return _make_request("/unforgivable", {"text": text})
-
-def couldread(text: str) -> str:
-    """
-    Generate "could you please read" meme.
-    
-    Args:
-        text (str): Text for the meme
-        
-    Returns:
-        str: URL of the meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> read_meme = couldread("the documentation")
-        >>> print(read_meme)
-        https://api.popcat.xyz/couldread?text=...
-    """
-    _validate_text(text)
-    return _make_request("/couldread", {"text": text})
+    return _make_request("/quote", {"image": image, "text": text, "name": name}, verify=verify)
 
 def lulcat(text: str) -> Dict[str, Any]:
     """
@@ -420,7 +278,7 @@ def lulcat(text: str) -> Dict[str, Any]:
         
     Raises:
         ValueError: If text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> lulcat_data = lulcat("I can haz cheezburger?")
@@ -430,72 +288,6 @@ def lulcat(text: str) -> Dict[str, Any]:
     _validate_text(text)
     return _make_json_request("/lulcat", {"text": text})
 
-def facts(text: str) -> str:
-    """
-    Generate "facts" meme with custom text.
-    
-    Args:
-        text (str): Fact text
-        
-    Returns:
-        str: URL of the facts meme
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> facts_meme = facts("Python is awesome")
-        >>> print(facts_meme)
-        https://api.popcat.xyz/facts?text=...
-    """
-    _validate_text(text)
-    return _make_request("/facts", {"text": text})
-
-def alert(text: str) -> str:
-    """
-    Generate warning alert sign.
-    
-    Args:
-        text (str): Alert message
-        
-    Returns:
-        str: URL of the alert sign
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> alert_sign = alert("DANGER: High Voltage")
-        >>> print(alert_sign)
-        https://api.popcat.xyz/alert?text=...
-    """
-    _validate_text(text)
-    return _make_request("/alert", {"text": text})
-
-def caution(text: str) -> str:
-    """
-    Generate caution warning sign.
-    
-    Args:
-        text (str): Caution message
-        
-    Returns:
-        str: URL of the caution sign
-        
-    Raises:
-        ValueError: If text is invalid
-        Exception: If API request fails
-        
-    Example:
-        >>> caution_sign = caution("Wet Floor")
-        >>> print(caution_sign)
-        https://api.popcat.xyz/caution?text=...
-    """
-    _validate_text(text)
-    return _make_request("/caution", {"text": text})
-
 # Export all functions
 __all__ = [
     'drake', 'pooh', 'ship', 'supreme', 'oogway', 'biden', 'pikachu', 
@@ -15,49 +15,20 @@ Available Functions:
     - _8ball(): Alias for eightball() with alternative name
 """
 
-import requests
 from typing import Dict, Any, Union
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._http import BASE_URL, _loads, get_url, url_for
 
-def _make_request(endpoint: str) -> Union[str, Dict[str, Any]]:
-    """Make a request to the API and return the result."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}")
-        response.raise_for_status()
-        
-        # Try to parse as JSON first
-        try:
-            data = response.json()
-            
-            # For simple string responses, extract the main content
-            if 'joke' in data and len(data) == 1:
-                return data['joke']
-            elif 'fact' in data and len(data) == 1:
-                return data['fact']
-            elif 'answer' in data and len(data) == 1:
-                return data['answer']
-            else:
-                # Return full data for complex responses
-                return data
-                
-        except ValueError:
-            # If not JSON, return as text
-            return response.text
-            
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-def joke() -> str:
-    """
+# Endpoints shared with the async client: function name -> (endpoint, docstring)
+_ENDPOINTS = {
+    "joke": ("/joke", """
     Get a random joke.
     
     Returns:
         str: Random joke text
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> random_joke = joke()
@@ -67,18 +38,15 @@ def joke() -> str:
         >>> another_joke = joke()
         >>> print(another_joke)
         What do you call a fake noodle? An impasta!
-    """
-    return _make_request("/joke")
-
-def fact() -> str:
-    """
+    """),
+    "fact": ("/fact", """
     Get a random interesting fact.
     
     Returns:
         str: Random fact text
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> random_fact = fact()
@@ -88,18 +56,15 @@ def fact() -> str:
         >>> another_fact = fact()
         >>> print(another_fact)
         Honey never spoils. Archaeologists have found edible honey in ancient Egyptian tombs.
-    """
-    return _make_request("/fact")
-
-def randommeme() -> Dict[str, Any]:
-    """
+    """),
+    "randommeme": ("/randommeme", """
     Get a random meme from the internet.
     
     Returns:
         Dict[str, Any]: Random meme with image URL, title, and metadata
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> meme_data = randommeme()
@@ -113,18 +78,15 @@ def randommeme() -> Dict[str, Any]:
             'awards': 3,
             ...
         }
-    """
-    return _make_request("/randommeme")
-
-def car() -> Dict[str, Any]:
-    """
+    """),
+    "car": ("/car", """
     Get information about a random car.
     
     Returns:
         Dict[str, Any]: Random car information including make, model, year, specs
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> car_info = car()
@@ -140,18 +102,15 @@ def car() -> Dict[str, Any]:
             'price': '$25,000',
             ...
         }
-    """
-    return _make_request("/car")
-
-def showerthought() -> Dict[str, Any]:
-    """
+    """),
+    "showerthought": ("/showerthought", """
     Get a random shower thought from Reddit.
     
     Returns:
         Dict[str, Any]: Random shower thought with text and metadata
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> thought = showerthought()
@@ -164,18 +123,15 @@ def showerthought() -> Dict[str, Any]:
             'date': '2023-01-15',
             ...
         }
-    """
-    return _make_request("/showerthought")
-
-def wouldyourather() -> Dict[str, Any]:
-    """
+    """),
+    "wouldyourather": ("/wouldyourather", """
     Get a random "would you rather" question.
     
     Returns:
         Dict[str, Any]: Would you rather question with two options
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> wyr = wouldyourather()
@@ -188,18 +144,15 @@ def wouldyourather() -> Dict[str, Any]:
             'votes2': 40,
             ...
         }
-    """
-    return _make_request("/wouldyourather")
-
-def eightball() -> str:
-    """
+    """),
+    "eightball": ("/8ball", """
     Get a magic 8-ball response.
     
     Returns:
         str: Magic 8-ball answer
         
     Raises:
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> answer = eightball()
@@ -209,32 +162,56 @@ def eightball() -> str:
         >>> answer = eightball()
         >>> print(answer)
         Ask again later.
-    """
-    return _make_request("/8ball")
+    """),
+}
 
-def _8ball() -> str:
-    """
-    Get a magic 8-ball response (alternative name).
-    
-    This is an alias for eightball() with an alternative naming convention
-    that starts with an underscore to make it a valid Python identifier.
+# Keys of single-field responses that are returned as a plain string
+_SINGLE_KEYS = frozenset(("joke", "fact", "answer"))
+
+def _parse_body(body: bytes, text: str) -> Union[str, Dict[str, Any]]:
+    """Return the main content of a response body, or the text if it is not JSON."""
+    # Try to parse as JSON first
+    try:
+        data = _loads(body)
+    except ValueError:
+        # If not JSON, return as text
+        return text
     
-    Returns:
-        str: Magic 8-ball answer
-        
-    Raises:
-        Exception: If API request fails
-        
-    Example:
-        >>> answer = _8ball()
-        >>> print(answer)
-        Signs point to yes.
-        
-        >>> answer = _8ball()
-        >>> print(answer)
-        Don't count on it.
-    """
-    return eightball()
+    # For simple string responses, extract the main content
+    if isinstance(data, dict) and len(data) == 1:
+        key = next(iter(data))
+        if key in _SINGLE_KEYS:
+            return data[key]
+    # Return full data for complex responses
+    return data
+
+def _make_request(url: str) -> Union[str, Dict[str, Any]]:
+    """Make a request to a full API URL and return the result."""
+    response = get_url(url)
+    return _parse_body(response.content, response.text)
+
+# Source template for the generated endpoint functions, with the URL baked in as a literal
+_TEMPLATE = """
+def {name}() -> Union[str, Dict[str, Any]]:
+    return _make_request({url!r})
+"""
+
+def _make_endpoint(name: str, endpoint: str, doc: str):
+    """Generate an endpoint function taking no arguments."""
+    namespace = {'__name__': __name__, 'Union': Union, 'Dict': Dict, 'Any': Any,
+                 '_make_request': _make_request}
+    source = _TEMPLATE.format(name=name, url=url_for(endpoint))
+    exec(compile(source, f"<popcat.random.{name}>", "exec"), namespace)
+    func = namespace[name]
+    func.__doc__ = doc
+    return func
+
+for _name, _spec in _ENDPOINTS.items():
+    globals()[_name] = _make_endpoint(_name, *_spec)
+del _name, _spec
+
+# Alternative name for eightball; the same function object, so calls cost no extra frame
+_8ball = eightball  # noqa: F821 - defined by the loop above
 
 # Export all functions
 __all__ = [
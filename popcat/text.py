@@ -2,10 +2,14 @@
 Text Utilities Module
 
 This module provides functions for manipulating and transforming text.
-All functions return processed strings.
+All functions return processed strings. ``reverse``, ``doublestruck``, ``encode`` and
+``decode`` are computed locally; pass ``remote=True`` to ask the API instead. API
+results are cached in memory, since the same input always produces the same output;
+pass ``use_cache=False`` to skip it.
 
 Available Functions:
     - translate(text, to): Translate text to another language
+    - translate_batch(texts, to, max_workers=16): Translate many texts in parallel
     - reverse(text): Reverse the order of characters in text
     - mock(text): Convert text to mocking SpongeBob format
     - doublestruck(text): Convert text to mathematical double-struck format
@@ -14,65 +18,79 @@ Available Functions:
     - decode(binary): Decode binary to readable text
 """
 
-import requests
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List
 from urllib.parse import quote
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._cache import TTLCache, cached
+from ._http import BASE_URL, _decode_json, get
+from ._validate import _validate_text
+from .utilities import batch
 
-def _validate_text(text: str) -> None:
-    """Validate that the provided text is valid."""
-    if not text or not isinstance(text, str):
-        raise ValueError("Text must be a non-empty string")
+# Text transforms are deterministic, so results are kept until evicted
+_TEXT_CACHE = TTLCache(maxsize=4096)
 
-def _make_request(endpoint: str, params: dict) -> str:
-    """Make a request to the API and return the text result."""
+# Translation table deleting the whitespace allowed between binary chunks
+_STRIP_WHITESPACE = str.maketrans('', '', ' \t\n')
+
+def _validate_binary(binary: str) -> None:
+    """Validate that the provided string is whitespace-separated binary."""
+    _validate_text(binary)
+    # str.strip runs in C, so anything left over is a character other than 0 or 1
+    if binary.translate(_STRIP_WHITESPACE).strip('01'):
+        raise ValueError("Binary string must contain only 0s and 1s")
+
+def _make_request(endpoint: str, params: dict, key: str = 'text') -> str:
+    """Make a request to the API and return the ``key`` field of the JSON result."""
+    response = get(endpoint, params)
+    
+    # Only JSON responses need parsing; anything else is the text itself
+    if 'json' in response.headers.get('Content-Type', ''):
+        data = _decode_json(response)
+        if key in data:
+            return data[key]
+    return response.text
+
+# Mathematical double-struck letters and digits. A few capitals predate the
+# mathematical block and live in Letterlike Symbols instead.
+_DS_EXCEPTIONS = {"C": "ℂ", "H": "ℍ", "N": "ℕ", "P": "ℙ", "Q": "ℚ", "R": "ℝ", "Z": "ℤ"}
+_DS_TABLE = str.maketrans({
+    **{chr(ord("A") + i): chr(0x1D538 + i) for i in range(26)},
+    **_DS_EXCEPTIONS,
+    **{chr(ord("a") + i): chr(0x1D552 + i) for i in range(26)},
+    **{chr(ord("0") + i): chr(0x1D7D8 + i) for i in range(10)},
+})
+
+def _decode_binary(binary: str) -> str:
+    """Decode space-separated 8-bit chunks as UTF-8."""
     try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        
-        # Try to parse as JSON first, then fall back to text
-        try:
-            data = response.json()
-            # Different endpoints return data in different formats
-            if 'translated' in data:
-                return data['translated']
-            elif 'text' in data:
-                return data['text']
-            elif 'morse' in data:
-                return data['morse']
-            elif 'binary' in data:
-                return data['binary']
-            elif 'decoded' in data:
-                return data['decoded']
-            else:
-                # If we have a simple response, return the first string value
-                for value in data.values():
-                    if isinstance(value, str):
-                        return value
-                return str(data)
-        except ValueError:
-            # If not JSON, return as text
-            return response.text
-            
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
+        return bytes(int(chunk, 2) for chunk in binary.split()).decode("utf-8")
+    except ValueError:
+        raise ValueError("Binary string must be space-separated 8-bit chunks of UTF-8 text")
+
+# Requests reusing the result of an identical earlier call
+_cached_request = cached(_TEXT_CACHE)(_make_request)
 
-def translate(text: str, to: str) -> str:
+def _request(endpoint: str, params: dict, use_cache: bool, key: str = 'text') -> str:
+    """Dispatch to the cached or uncached request helper."""
+    if use_cache:
+        return _cached_request(endpoint, params, key)
+    return _make_request(endpoint, params, key)
+
+def translate(text: str, to: str, use_cache: bool = True) -> str:
     """
     Translate text to another language.
     
     Args:
         text (str): Text to translate
         to (str): Target language code (e.g., "es", "fr", "de", "ja", "zh")
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
         
     Returns:
         str: Translated text
         
     Raises:
         ValueError: If text or language code is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> translated = translate("Hello world", "es")
@@ -86,21 +104,52 @@ def translate(text: str, to: str) -> str:
     _validate_text(text)
     _validate_text(to)
     
-    return _make_request("/translate", {"text": text, "to": to})
+    return _request("/translate", {"text": text, "to": to}, use_cache, 'translated')
 
-def reverse(text: str) -> str:
+def translate_batch(texts: Iterable[str], to: str, max_workers: int = 16,
+                    use_cache: bool = True) -> List[str]:
+    """
+    Translate many texts to the same language in parallel.
+    
+    Requests run on a thread pool over the shared connection pool, which is safe
+    to use from several threads, so this speeds up long lists without asyncio.
+    
+    Args:
+        texts (Iterable[str]): Texts to translate
+        to (str): Target language code (e.g., "es", "fr", "de", "ja", "zh")
+        max_workers (int, optional): Maximum number of requests in flight. Defaults to 16
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
+        
+    Returns:
+        List[str]: Translations in the same order as ``texts``
+        
+    Raises:
+        ValueError: If the language code is invalid
+        BatchError: If any text is invalid or its API request fails
+        
+    Example:
+        >>> translate_batch(["Hello", "Goodbye"], "es")
+        ['Hola', 'Adiós']
+    """
+    _validate_text(to)
+    return batch([(translate, (text, to), {"use_cache": use_cache}) for text in texts],
+                 max_workers=max_workers)
+
+def reverse(text: str, use_cache: bool = True, remote: bool = False) -> str:
     """
     Reverse the order of characters in text.
     
     Args:
         text (str): Text to reverse
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
+        remote (bool, optional): Ask the API instead of computing the result locally. Defaults to False
         
     Returns:
         str: Reversed text
         
     Raises:
         ValueError: If text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If remote is set and the API request fails
         
     Example:
         >>> reversed_text = reverse("Hello World")
@@ -112,21 +161,24 @@ def reverse(text: str) -> str:
         nohtyP
     """
     _validate_text(text)
-    return _make_request("/reverse", {"text": text})
+    if not remote:
+        return text[::-1]
+    return _request("/reverse", {"text": text}, use_cache)
 
-def mock(text: str) -> str:
+def mock(text: str, use_cache: bool = True) -> str:
     """
     Convert text to mocking SpongeBob format (aLtErNaTiNg CaPiTaLs).
     
     Args:
         text (str): Text to mock
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
         
     Returns:
         str: Mocking text with alternating capitals
         
     Raises:
         ValueError: If text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> mocked = mock("This is a test")
@@ -138,21 +190,23 @@ def mock(text: str) -> str:
         pYtHoN iS aWeSoMe
     """
     _validate_text(text)
-    return _make_request("/mock", {"text": text})
+    return _request("/mock", {"text": text}, use_cache)
 
-def doublestruck(text: str) -> str:
+def doublestruck(text: str, use_cache: bool = True, remote: bool = False) -> str:
     """
     Convert text to mathematical double-struck format.
     
     Args:
         text (str): Text to convert
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
+        remote (bool, optional): Ask the API instead of computing the result locally. Defaults to False
         
     Returns:
         str: Double-struck text using Unicode mathematical characters
         
     Raises:
         ValueError: If text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If remote is set and the API request fails
         
     Example:
         >>> ds_text = doublestruck("Hello")
@@ -164,21 +218,24 @@ def doublestruck(text: str) -> str:
         ℙ𝕪𝕥𝕙𝕠𝕟
     """
     _validate_text(text)
-    return _make_request("/doublestruck", {"text": text})
+    if not remote:
+        return text.translate(_DS_TABLE)
+    return _request("/doublestruck", {"text": text}, use_cache)
 
-def texttomorse(text: str) -> str:
+def texttomorse(text: str, use_cache: bool = True) -> str:
     """
     Convert text to Morse code.
     
     Args:
         text (str): Text to convert to Morse code
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
         
     Returns:
         str: Morse code representation using dots and dashes
         
     Raises:
         ValueError: If text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> morse = texttomorse("SOS")
@@ -190,21 +247,23 @@ def texttomorse(text: str) -> str:
         .... . .-.. .-.. ---
     """
     _validate_text(text)
-    return _make_request("/texttomorse", {"text": text})
+    return _request("/texttomorse", {"text": text}, use_cache, 'morse')
 
-def encode(text: str) -> str:
+def encode(text: str, use_cache: bool = True, remote: bool = False) -> str:
     """
     Encode text to binary format.
     
     Args:
         text (str): Text to encode
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
+        remote (bool, optional): Ask the API instead of computing the result locally. Defaults to False
         
     Returns:
         str: Binary representation of the text
         
     Raises:
         ValueError: If text is invalid
-        Exception: If API request fails
+        PopcatAPIError: If remote is set and the API request fails
         
     Example:
         >>> binary = encode("Hi")
@@ -216,21 +275,25 @@ def encode(text: str) -> str:
         01000001
     """
     _validate_text(text)
-    return _make_request("/encode", {"text": text})
+    if not remote:
+        return ' '.join(format(byte, '08b') for byte in text.encode('utf-8'))
+    return _request("/encode", {"text": text}, use_cache, 'binary')
 
-def decode(binary: str) -> str:
+def decode(binary: str, use_cache: bool = True, remote: bool = False) -> str:
     """
     Decode binary to readable text.
     
     Args:
         binary (str): Binary string to decode (space-separated 8-bit chunks)
+        use_cache (bool, optional): Reuse the result of an identical earlier call. Defaults to True
+        remote (bool, optional): Ask the API instead of computing the result locally. Defaults to False
         
     Returns:
         str: Decoded text
         
     Raises:
         ValueError: If binary string is invalid
-        Exception: If API request fails
+        PopcatAPIError: If remote is set and the API request fails
         
     Example:
         >>> decoded = decode("01001000 01101001")
@@ -241,16 +304,13 @@ def decode(binary: str) -> str:
         >>> print(decoded)
         A
     """
-    _validate_text(binary)
-    # Basic validation for binary format
-    binary_clean = binary.replace(' ', '')
-    if not all(c in '01' for c in binary_clean):
-        raise ValueError("Binary string must contain only 0s and 1s")
-    
-    return _make_request("/decode", {"binary": binary})
+    _validate_binary(binary)
+    if not remote:
+        return _decode_binary(binary)
+    return _request("/decode", {"binary": binary}, use_cache, 'decoded')
 
 # Export all functions
 __all__ = [
-    'translate', 'reverse', 'mock', 'doublestruck', 
+    'translate', 'translate_batch', 'reverse', 'mock', 'doublestruck', 
     'texttomorse', 'encode', 'decode'
 ]
\ No newline at end of file
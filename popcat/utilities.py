@@ -9,63 +9,49 @@ Available Functions:
     - screenshot(url): Take a screenshot of any website
     - chatbot(message, ownername, botname): Get AI chatbot response
     - welcomecard(background, avatar, text_1, text_2, text_3): Generate custom welcome card
+    - batch(calls, max_workers=10): Run several wrapper calls in parallel
+
+Available Classes:
+    - BatchError: Raised by batch() with every failed call
 """
 
-import requests
-from typing import Dict, Any
-from urllib.parse import quote, urlparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, List, Tuple, Union
+from urllib.parse import quote
 
-# Base URL for the Popcat API
-BASE_URL = "https://api.popcat.xyz"
+from ._cache import TTLCache, cached
+from ._http import BASE_URL, get_json, resolve_url
+from ._validate import _validate_text, _validate_texts, _validate_url
 
-def _validate_text(text: str) -> None:
-    """Validate that the provided text is valid."""
-    if not text or not isinstance(text, str):
-        raise ValueError("Text must be a non-empty string")
+# Lyrics rarely change, but search results can, so entries expire after five minutes
+_LYRICS_CACHE = TTLCache(maxsize=1024, ttl=300)
 
-def _validate_url(url: str) -> None:
-    """Validate that the provided string is a valid URL."""
-    if not url or not isinstance(url, str):
-        raise ValueError("URL must be a non-empty string")
-    
-    parsed = urlparse(url)
-    if not parsed.scheme or not parsed.netloc:
-        raise ValueError("URL must be a valid HTTP/HTTPS URL")
-    
-    if parsed.scheme not in ['http', 'https']:
-        raise ValueError("URL must use HTTP or HTTPS protocol")
-
-def _make_json_request(endpoint: str, params: dict) -> Dict[str, Any]:
-    """Make a request to the API and return JSON data."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-def _make_request(endpoint: str, params: dict) -> str:
-    """Make a request to the API and return the response URL or content."""
-    try:
-        response = requests.get(f"{BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.url
-    except requests.RequestException as e:
-        raise Exception(f"API request failed: {str(e)}")
-
-def lyrics(song: str) -> Dict[str, Any]:
+def _validate_background(background: str) -> None:
+    """Validate the welcome card background, which must be an HTTPS PNG URL."""
+    parsed = _validate_url(background)
+    if not parsed.path.lower().endswith('.png'):
+        raise ValueError("Background image must be a PNG file")
+    if parsed.scheme != 'https':
+        raise ValueError("Background image URL must use HTTPS")
+
+# Lyrics lookups, reusing a recent result for the same input
+_cached_json_request = cached(_LYRICS_CACHE)(get_json)
+
+def lyrics(song: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Get lyrics for any song.
     
     Args:
         song (str): Song name or "artist - song" format
+        use_cache (bool, optional): Reuse a result fetched in the last five minutes. Defaults to True
         
     Returns:
         Dict[str, Any]: Song lyrics and metadata including title, artist, album
         
     Raises:
         ValueError: If song name is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> song_lyrics = lyrics("Bohemian Rhapsody Queen")
@@ -91,7 +77,9 @@ def lyrics(song: str) -> Dict[str, Any]:
         }
     """
     _validate_text(song)
-    return _make_json_request("/lyrics", {"song": song})
+    if use_cache:
+        return _cached_json_request("/lyrics", {"song": song})
+    return get_json("/lyrics", {"song": song})
 
 def screenshot(url: str) -> str:
     """
@@ -101,11 +89,11 @@ def screenshot(url: str) -> str:
         url (str): Valid website URL to screenshot
         
     Returns:
-        str: URL of the screenshot image
+        str: URL of the screenshot image (request the URL yourself to download it)
         
     Raises:
         ValueError: If URL is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> screenshot_url = screenshot("https://github.com")
@@ -117,7 +105,7 @@ def screenshot(url: str) -> str:
         https://api.popcat.xyz/screenshot?url=https%3A//stackoverflow.com
     """
     _validate_url(url)
-    return _make_request("/screenshot", {"url": url})
+    return resolve_url("/screenshot", {"url": url})
 
 def chatbot(message: str, ownername: str, botname: str) -> Dict[str, Any]:
     """
@@ -133,7 +121,7 @@ def chatbot(message: str, ownername: str, botname: str) -> Dict[str, Any]:
         
     Raises:
         ValueError: If any parameter is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> bot_response = chatbot("Hello there!", "John", "MyBot")
@@ -156,11 +144,9 @@ def chatbot(message: str, ownername: str, botname: str) -> Dict[str, Any]:
             ...
         }
     """
-    _validate_text(message)
-    _validate_text(ownername)
-    _validate_text(botname)
+    _validate_texts(message, ownername, botname)
     
-    return _make_json_request("/chatbot", {
+    return get_json("/chatbot", {
         "msg": message,
         "owner": ownername,
         "botname": botname
@@ -178,11 +164,11 @@ def welcomecard(background: str, avatar: str, text_1: str, text_2: str, text_3:
         text_3 (str): Welcome text line 3 (e.g., server info)
         
     Returns:
-        str: URL of the welcome card image
+        str: URL of the welcome card image (request the URL yourself to download it)
         
     Raises:
         ValueError: If any parameter is invalid
-        Exception: If API request fails
+        PopcatAPIError: If API request fails
         
     Example:
         >>> welcome_img = welcomecard(
@@ -203,19 +189,11 @@ def welcomecard(background: str, avatar: str, text_1: str, text_2: str, text_3:
         ...     "You are member #1337"
         ... )
     """
-    _validate_url(background)
+    _validate_background(background)
     _validate_url(avatar)
-    _validate_text(text_1)
-    _validate_text(text_2)
-    _validate_text(text_3)
+    _validate_texts(text_1, text_2, text_3)
     
-    # Additional validation for background image
-    if not background.lower().endswith('.png'):
-        raise ValueError("Background image must be a PNG file")
-    if not background.startswith('https://'):
-        raise ValueError("Background image URL must use HTTPS")
-    
-    return _make_request("/welcomecard", {
+    return resolve_url("/welcomecard", {
         "background": background,
         "avatar": avatar,
         "text1": text_1,
@@ -223,7 +201,103 @@ def welcomecard(background: str, avatar: str, text_1: str, text_2: str, text_3:
         "text3": text_3
     })
 
+class BatchError(Exception):
+    """
+    Raised by :func:`batch` when one or more calls fail.
+    
+    Every call still runs to completion. The first failure is chained as ``__cause__``.
+    
+    Attributes:
+        errors (List[Tuple[int, Exception]]): ``(index, exception)`` for each failed call
+        results (List[Any]): Results in input order, with the exception in place of each failed call
+    """
+    
+    def __init__(self, errors: List[Tuple[int, Exception]], results: List[Any]):
+        index, first = errors[0]
+        super().__init__(
+            f"{len(errors)} of {len(results)} batched calls failed; "
+            f"first failure at index {index}: {first!r}"
+        )
+        self.errors = errors
+        self.results = results
+
+def _resolve(func: Union[str, Callable]) -> Callable:
+    """Return the wrapper function for a call, looking names up on the package."""
+    if not isinstance(func, str):
+        return func
+    resolved = getattr(sys.modules[__package__], func, None)
+    if not callable(resolved):
+        raise ValueError(f"Unknown function: {func!r}")
+    return resolved
+
+def batch(calls: Iterable[Tuple], max_workers: int = 10) -> List[Any]:
+    """
+    Run several wrapper calls in parallel.
+    
+    Calls are executed on a bounded thread pool and share the pooled HTTP session,
+    so independent requests overlap instead of running one after another. A failed
+    call does not stop the others; the failures are reported together afterwards.
+    
+    Args:
+        calls (Iterable[Tuple]): ``(func, args, kwargs)``, ``(func, kwargs)`` or ``(func, args)``
+            tuples, where ``func`` is a wrapper function or the name of one (e.g. ``"weather"``),
+            ``args`` is a tuple or list and ``kwargs`` is a dict
+        max_workers (int, optional): Maximum number of calls in flight. Defaults to 10
+        
+    Returns:
+        List[Any]: Results in the same order as ``calls``
+        
+    Raises:
+        ValueError: If max_workers is less than 1, a call is malformed or a function name is unknown
+        BatchError: If any call raised, after every call has finished
+        
+    Example:
+        >>> drake_meme, logo, jailed = batch([
+        ...     (drake, ("Sequential calls", "Parallel calls"), {}),
+        ...     (supreme, ("POPCAT",), {}),
+        ...     (jail, ("https://example.com/image.png",), {"verify": True}),
+        ... ])
+        
+        >>> london, octocat = batch([
+        ...     ("weather", {"place": "London"}),
+        ...     ("github", {"username": "octocat"}),
+        ... ])
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    
+    # Normalize up front so an unknown name fails before any request is sent
+    jobs = []
+    for call in calls:
+        if not isinstance(call, (tuple, list)) or len(call) not in (2, 3):
+            raise ValueError(f"Invalid call: {call!r}")
+        if len(call) == 2:
+            # (func, kwargs) when the second item is a dict, (func, args) otherwise
+            func, extra = call
+            args, kwargs = ((), extra) if isinstance(extra, dict) else (extra, {})
+        else:
+            func, args, kwargs = call
+        if not isinstance(args, (tuple, list)) or not isinstance(kwargs, dict):
+            raise ValueError(f"Invalid call: {call!r}")
+        jobs.append((_resolve(func), args, kwargs))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args, **kwargs) for func, args, kwargs in jobs]
+    
+    results = []
+    errors = []
+    for index, future in enumerate(futures):
+        error = future.exception()
+        if error is not None:
+            errors.append((index, error))
+            results.append(error)
+        else:
+            results.append(future.result())
+    if errors:
+        raise BatchError(errors, results) from errors[0][1]
+    return results
+
 # Export all functions
 __all__ = [
-    'lyrics', 'screenshot', 'chatbot', 'welcomecard'
+    'lyrics', 'screenshot', 'chatbot', 'welcomecard', 'batch', 'BatchError'
 ]
\ No newline at end of file
@@ -25,8 +25,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
@@ -38,7 +36,7 @@ setup(
         "Topic :: Games/Entertainment",
         "Topic :: Text Processing :: General",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
         "requests>=2.25.0",
     ],
@@ -49,14 +47,29 @@ setup(
             "mypy>=0.950",
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
+            "pytest-xdist>=3.0.0",
+            "pytest-socket>=0.6.0",
             "twine>=4.0.0",
             "build>=0.8.0",
         ],
         "test": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
+            "pytest-xdist>=3.0.0",
+            "pytest-socket>=0.6.0",
             "responses>=0.20.0",
         ],
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "fast": [
+            "orjson>=3.10",
+            "brotli>=1.0.9; platform_python_implementation == 'CPython'",
+            "brotlicffi>=0.8.0; platform_python_implementation != 'CPython'",
+        ],
         "docs": [
             "sphinx>=4.0.0",
             "sphinx-rtd-theme>=1.0.0",
@@ -0,0 +1,8 @@
+"""
+Assertion helpers shared by the test modules.
+"""
+
+
+def assert_dict_has(result, *keys):
+    """Assert that ``result`` is a plain dict containing every key in ``keys``."""
+    assert type(result) is dict and result.keys() >= set(keys), result
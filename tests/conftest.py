@@ -0,0 +1,171 @@
+"""
+Shared pytest fixtures.
+"""
+
+import functools
+import json
+from urllib.parse import quote_plus, urlsplit
+
+import pytest
+import requests
+import responses
+
+import popcat
+from popcat import _http
+
+# Canned JSON bodies served for these (method, API path) pairs
+_PAYLOADS = {
+    ("GET", "/weather"): {
+        "location": "London, England",
+        "temperature": "15°C",
+        "condition": "Partly Cloudy",
+        "humidity": "65%"
+    },
+    ("GET", "/github"): {
+        "username": "octocat",
+        "name": "The Octocat",
+        "public_repos": 8,
+        "followers": 9001
+    },
+    ("GET", "/npm"): {
+        "name": "express",
+        "version": "4.18.2",
+        "description": "Fast, unopinionated, minimalist web framework"
+    },
+    ("GET", "/colorinfo"): {
+        "hex": "#FF0000",
+        "rgb": {"r": 255, "g": 0, "b": 0},
+        "name": "Red"
+    },
+    ("GET", "/randomcolor"): {
+        "hex": "#3A7BD5",
+        "rgb": {"r": 58, "g": 123, "b": 213},
+        "name": "Steel Blue"
+    },
+    ("GET", "/country"): {
+        "name": "Japan",
+        "capital": "Tokyo",
+        "population": 125800000,
+        "currency": "Japanese Yen"
+    },
+    ("GET", "/periodic_table"): {
+        "name": "Carbon",
+        "symbol": "C",
+        "atomic_number": 6,
+        "atomic_mass": "12.011"
+    },
+    ("GET", "/subreddit"): {
+        "name": "python",
+        "title": "Python",
+        "subscribers": 1200000,
+        "is_nsfw": False
+    },
+    ("GET", "/lulcat"): {"url": "https://example.com/lulcat.png"},
+    ("GET", "/shorten/example"): {
+        "extension": "example",
+        "original_url": "https://example.com",
+        "clicks": 42
+    },
+    ("POST", "/code"): {
+        "url": "https://code.popcat.xyz/ABC123",
+        "id": "ABC123",
+        "title": "Test Code",
+        "theme": "GitHub Dark",
+        "language": "PlainText"
+    },
+    ("POST", "/shorten"): {
+        "short_url": "https://popcat.xyz/example",
+        "original_url": "https://example.com",
+        "extension": "example"
+    },
+}
+
+# The payloads serialized once at import, so serving one only copies a reference
+_BODIES = {key: json.dumps(payload).encode("utf-8") for key, payload in _PAYLOADS.items()}
+
+_API_PREFIX = "https://api.popcat.xyz/"
+
+# HTTPAdapter.send as shipped by requests, before any test patches it
+_REAL_SEND = requests.adapters.HTTPAdapter.send
+
+# Requests answered from _PAYLOADS since the last api_calls fixture
+_API_CALLS = []
+
+
+def _fast_send(adapter, request, **kwargs):
+    """
+    Answer API requests from ``_BODIES`` with a single dict lookup.
+
+    Other hosts, such as the local test servers, get the real transport. API
+    requests without a payload fail as unreachable.
+    """
+    if not request.url.startswith(_API_PREFIX):
+        return _REAL_SEND(adapter, request, **kwargs)
+    body = _BODIES.get((request.method, urlsplit(request.url).path))
+    if body is None:
+        raise requests.ConnectionError(f"No canned response for {request.method} {request.url}")
+    _API_CALLS.append(request)
+    
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.headers["Content-Type"] = "application/json"
+    response._content = body
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    response.connection = adapter
+    return response
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_api():
+    """
+    Serve ``_PAYLOADS`` for the whole run by patching ``HTTPAdapter.send``.
+    
+    Per-test ``responses`` mocks patch the same method, so they take over while
+    active and hand back to this one when they exit.
+    """
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(requests.adapters.HTTPAdapter, "send", _fast_send)
+        yield
+
+
+@pytest.fixture
+def live_api(monkeypatch):
+    """Send requests to the real API for the duration of a test."""
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", _REAL_SEND)
+
+
+# The tests build URLs from the same few inputs over and over. quote_plus is pure, so
+# its results are shared for the whole run. The wrapper is built here, at module
+# level, rather than in the fixture, so every test patches in the same cache.
+_cached_quote_plus = functools.lru_cache(maxsize=256)(quote_plus)
+
+
+@pytest.fixture(autouse=True)
+def _memoize_quote_plus(monkeypatch):
+    """Encode query parameters for locally built URLs through the shared cache."""
+    monkeypatch.setattr(_http, "quote_plus", _cached_quote_plus)
+
+
+@pytest.fixture
+def api_calls():
+    """Requests answered by the shared API mock during the current test."""
+    _API_CALLS.clear()
+    return _API_CALLS
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    """Keep cached API responses from leaking between tests."""
+    popcat.clear_cache()
+    yield
+    popcat.clear_cache()
+
+
+@pytest.fixture
+def mock_api():
+    """Intercept requests for one test; register responses with ``mock_api.add``."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        yield mock
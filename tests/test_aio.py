@@ -0,0 +1,175 @@
+"""
+Tests for the async client.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from popcat import aio
+from popcat.aio import AsyncPopcat
+
+
+async def _handler(request):
+    """Fake Popcat API: JSON for /lulcat, /translate, /github and /joke, 500 for /fail, empty 200 otherwise."""
+    if request.path == "/github":
+        return web.json_response({"login": request.query["user"]})
+    if request.path == "/joke":
+        return web.json_response({"joke": "Knock knock"})
+    if request.path == "/lulcat":
+        return web.json_response({"url": "https://example.com/lulcat.png"})
+    if request.path == "/translate":
+        return web.json_response({"translated": f"{request.query['to']}:{request.query['text']}"})
+    if request.path == "/fail":
+        return web.Response(status=500)
+    return web.Response(status=200)
+
+
+def _run(monkeypatch, func):
+    """Run ``func(client)`` against a local fake API server."""
+    async def main():
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", _handler)
+        async with TestServer(app) as server:
+            monkeypatch.setattr(aio, "BASE_URL", str(server.make_url("")).rstrip("/"))
+            async with AsyncPopcat() as client:
+                return await func(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncPopcat:
+    """Test cases for AsyncPopcat."""
+
+    def test_drake_meme(self, monkeypatch):
+        """Test async drake meme generation."""
+        result = _run(monkeypatch, lambda popcat: popcat.drake("Regular APIs", "Popcat API"))
+        assert isinstance(result, str)
+        assert result == "https://api.popcat.xyz/drake?text1=Regular+APIs&text2=Popcat+API"
+
+    def test_gather_runs_calls_concurrently(self, monkeypatch):
+        """Test that several calls can be gathered on one client."""
+        supreme, jail, lulcat = _run(monkeypatch, lambda popcat: asyncio.gather(
+            popcat.supreme("POPCAT"),
+            popcat.jail("https://example.com/image.png"),
+            popcat.lulcat("I can haz cheezburger?"),
+        ))
+
+        assert isinstance(supreme, str)
+        assert isinstance(jail, str)
+        assert isinstance(lulcat, dict)
+
+    def test_invalid_input_raises_before_request(self, monkeypatch):
+        """Test that validation matches the sync functions."""
+        with pytest.raises(ValueError, match="Image URL must start with http"):
+            _run(monkeypatch, lambda popcat: popcat.jail("not-a-url"))
+
+    def test_request_failure_raises(self, monkeypatch):
+        """Test that HTTP errors are surfaced as API failures."""
+        with pytest.raises(aio.PopcatAPIError, match="API request failed") as excinfo:
+            _run(monkeypatch, lambda popcat: popcat._make_request("/fail", {}, verify=True))
+        assert excinfo.value.status == 500
+        assert excinfo.value.endpoint == "/fail"
+
+    def test_verify_confirms_with_api(self, monkeypatch):
+        """Test that verify=True checks the generated URL against the API."""
+        result = _run(monkeypatch, lambda popcat: popcat.supreme("POPCAT", verify=True))
+        assert "/supreme?text=POPCAT" in result
+
+    def test_translate_many_keeps_order(self, monkeypatch):
+        """Test that translate_many returns translations in input order."""
+        result = _run(monkeypatch, lambda popcat: popcat.translate_many([
+            ("Hello", "es"), ("Bonjour", "de"), ("Hola", "fr"),
+        ]))
+        assert result == ["es:Hello", "de:Bonjour", "fr:Hola"]
+
+    def test_screenshot_resolves_url(self, monkeypatch):
+        """Test that screenshot resolves the URL with a HEAD request."""
+        result = _run(monkeypatch, lambda popcat: popcat.screenshot("https://github.com"))
+        assert "/screenshot?url=" in result
+
+    def test_decode_validation_matches_sync(self, monkeypatch):
+        """Test that decode rejects non-binary input before any request."""
+        with pytest.raises(ValueError, match="only 0s and 1s"):
+            _run(monkeypatch, lambda popcat: popcat.decode("0102"))
+
+    def test_data_and_random_methods(self, monkeypatch):
+        """Test that data and random calls can be gathered like the rest."""
+        github, joke = _run(monkeypatch, lambda popcat: asyncio.gather(
+            popcat.github("octocat"),
+            popcat.joke(),
+        ))
+
+        assert github == {"login": "octocat"}
+        assert joke == "Knock knock"
+
+    def test_data_argument_passed_by_keyword(self, monkeypatch):
+        """Test that async data methods take the same argument names as the sync functions."""
+        import inspect
+
+        from popcat import data
+
+        result = _run(monkeypatch, lambda popcat: popcat.github(username="octocat"))
+
+        assert result == {"login": "octocat"}
+        for name in data.__all__:
+            sync_params = list(inspect.signature(getattr(data, name)).parameters)[:1]
+            async_params = list(inspect.signature(getattr(AsyncPopcat, name)).parameters)[1:2]
+            assert async_params == [p for p in sync_params if p != "use_cache"], name
+
+    def test_mirrors_data_and_random_functions(self):
+        """Test that every data and random function has an async twin."""
+        from popcat import data, random
+
+        for name in data.__all__ + random.__all__:
+            assert asyncio.iscoroutinefunction(getattr(AsyncPopcat, name)), name
+        assert AsyncPopcat._8ball is AsyncPopcat.eightball
+
+    def test_data_methods_accept_only_exact_str(self, monkeypatch):
+        """Test that async data methods reject str subclasses like the sync functions."""
+        class Name(str):
+            pass
+
+        for value in (b"octocat", Name("octocat"), None, ""):
+            with pytest.raises(ValueError, match="Text must be a non-empty string"):
+                _run(monkeypatch, lambda popcat: popcat.github(value))
+
+    def test_http2_client_selected_by_environment(self, monkeypatch):
+        """Test that POPCAT_HTTP2=1 sends requests through httpx with the same results."""
+        pytest.importorskip("httpx")
+        monkeypatch.setenv("POPCAT_HTTP2", "1")
+
+        async def calls(popcat):
+            assert popcat._http2
+            results = await asyncio.gather(
+                popcat.lulcat("hello"),
+                popcat.translate("hello", "es"),
+                popcat.joke(),
+                popcat.supreme("POPCAT", verify=True),
+            )
+            assert popcat._session is None
+            return results
+
+        lulcat, translated, joke, supreme = _run(monkeypatch, calls)
+
+        assert lulcat == {"url": "https://example.com/lulcat.png"}
+        assert translated == "es:hello"
+        assert joke == "Knock knock"
+        assert "/supreme?text=POPCAT" in supreme
+
+    def test_http2_failure_keeps_status(self, monkeypatch):
+        """Test that httpx errors carry the status like aiohttp errors do."""
+        pytest.importorskip("httpx")
+
+        async def fail(popcat):
+            return await popcat._make_request("/fail", {}, verify=True)
+
+        monkeypatch.setenv("POPCAT_HTTP2", "1")
+        with pytest.raises(aio.PopcatAPIError) as excinfo:
+            _run(monkeypatch, fail)
+        assert excinfo.value.status == 500
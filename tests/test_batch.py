@@ -0,0 +1,72 @@
+"""
+Tests for running wrapper calls in parallel with batch().
+"""
+
+from popcat import data, meme, utilities
+import pytest
+import responses
+
+
+class TestBatch:
+    """Test cases for running calls in parallel with batch()."""
+
+    @responses.activate
+    def test_results_keep_input_order(self):
+        """Test that batch() returns results in the order of its calls."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lulcat",
+            json={"url": "https://example.com/lulcat.png"},
+            status=200
+        )
+
+        results = utilities.batch([
+            (meme.drake, ("Sequential calls", "Parallel calls"), {}),
+            (meme.lulcat, ("hello",), {}),
+            (meme.supreme, ("POPCAT",), {}),
+        ])
+
+        assert results[0].startswith("https://api.popcat.xyz/drake?")
+        assert results[1] == {"url": "https://example.com/lulcat.png"}
+        assert results[2] == "https://api.popcat.xyz/supreme?text=POPCAT"
+
+    def test_errors_are_aggregated(self):
+        """Test that failures are collected without stopping the other calls."""
+        with pytest.raises(utilities.BatchError) as excinfo:
+            utilities.batch([
+                (meme.supreme, ("",), {}),
+                (meme.supreme, ("POPCAT",), {}),
+                (meme.drake, ("one", ""), {}),
+            ])
+
+        error = excinfo.value
+        assert [index for index, _ in error.errors] == [0, 2]
+        assert isinstance(error.__cause__, ValueError)
+        assert error.results[1] == "https://api.popcat.xyz/supreme?text=POPCAT"
+
+    def test_functions_resolved_by_name(self):
+        """Test that calls can name a wrapper function with keyword arguments."""
+        results = utilities.batch([("supreme", {"text": "POPCAT"})])
+        assert results == ["https://api.popcat.xyz/supreme?text=POPCAT"]
+
+        with pytest.raises(ValueError, match="Unknown function"):
+            utilities.batch([("not_an_endpoint", {})])
+
+    def test_two_tuple_with_positional_args(self, api_calls):
+        """Test that a (func, args) pair passes its arguments positionally."""
+        result, = utilities.batch([(data.weather, ("London",))])
+        assert result["location"] == "London, England"
+        assert api_calls[0].url == "https://api.popcat.xyz/weather?q=London"
+
+    @pytest.mark.parametrize("call", [
+        (meme.supreme,),
+        (meme.supreme, "POPCAT"),
+        (meme.supreme, ("POPCAT",), {}, None),
+        (meme.supreme, {"text": "POPCAT"}, {}),
+        meme.supreme,
+    ], ids=["one-item", "bare-string", "four-items", "kwargs-as-args", "not-a-tuple"])
+    def test_malformed_call_rejected_before_requests(self, call, api_calls):
+        """Test that malformed calls raise ValueError before any call runs."""
+        with pytest.raises(ValueError, match="Invalid call"):
+            utilities.batch([(data.weather, ("London",)), call])
+        assert api_calls == []
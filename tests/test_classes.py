@@ -2,13 +2,13 @@
 Tests for specialized classes (CodeClient and Shortener).
 """
 
-import unittest
-from unittest.mock import patch, Mock
 from popcat.classes import CodeClient, Shortener
 
 import pytest
 import responses
 
+SHORTEN_URL = "https://api.popcat.xyz/shorten"
+
 
 class TestCodeClient:
     """Test cases for CodeClient class."""
@@ -26,25 +26,9 @@ class TestCodeClient:
         with pytest.raises(ValueError, match="API key must be a non-empty string"):
             CodeClient(None)
     
-    @responses.activate
     def test_create_bin_basic(self):
         """Test basic bin creation."""
         client = CodeClient("test-key")
-        mock_response = {
-            "url": "https://code.popcat.xyz/ABC123",
-            "id": "ABC123",
-            "title": "Test Code",
-            "theme": "GitHub Dark",
-            "language": "PlainText"
-        }
-        
-        responses.add(
-            responses.POST,
-            "https://api.popcat.xyz/code",
-            json=mock_response,
-            status=200
-        )
-        
         result = client.create_bin(
             "Test Code",
             "A test paste",
@@ -80,6 +64,18 @@ class TestCodeClient:
                 language="InvalidLanguage"
             )
     
+    def test_create_bin_non_str_theme_and_language(self):
+        """Test that unhashable or non-string theme and language raise ValueError."""
+        client = CodeClient("test-key")
+        
+        for theme in (["Monokai"], None, 5):
+            with pytest.raises(ValueError, match="Theme must be one of"):
+                client.create_bin("Test", "Description", "code", theme=theme)
+        
+        for language in (["Python"], None, 5):
+            with pytest.raises(ValueError, match="Language must be one of"):
+                client.create_bin("Test", "Description", "code", language=language)
+    
     def test_create_bin_empty_parameters(self):
         """Test bin creation with empty parameters."""
         client = CodeClient("test-key")
@@ -108,27 +104,33 @@ class TestCodeClient:
         assert len(languages) > 0
         assert "Python" in languages
         assert "JavaScript" in languages
+    
+    def test_create_bin_sends_bearer_token(self, api_calls):
+        """Test that the API key is sent, including after it is changed."""
+        client = CodeClient("first-key")
+        client.create_bin("Test Code", "A test paste", "print('hello')")
+        client.api_key = "second-key"
+        client.create_bin("Test Code", "A test paste", "print('hello')")
+        
+        assert api_calls[0].headers["Authorization"] == "Bearer first-key"
+        assert api_calls[1].headers["Authorization"] == "Bearer second-key"
+    
+    def test_create_bin_normalizes_language_case(self, api_calls):
+        """Test that the language is matched case-insensitively and sent canonically."""
+        import json
+        
+        client = CodeClient("test-key")
+        client.create_bin("Test Code", "A test paste", "let x = 1;", language="typescript")
+        
+        body = json.loads(api_calls[0].body)
+        assert body["language"] == "TypeScript"
 
 
 class TestShortener:
     """Test cases for Shortener class."""
     
-    @responses.activate
     def test_shorten_url(self):
         """Test URL shortening."""
-        mock_response = {
-            "short_url": "https://popcat.xyz/example",
-            "original_url": "https://example.com",
-            "extension": "example"
-        }
-        
-        responses.add(
-            responses.POST,
-            "https://api.popcat.xyz/shorten",
-            json=mock_response,
-            status=200
-        )
-        
         result = Shortener.shorten("https://example.com", "example")
         assert isinstance(result, dict)
         assert "short_url" in result
@@ -157,32 +159,22 @@ class TestShortener:
         with pytest.raises(ValueError, match="Extension must be between 3 and 20 characters"):
             Shortener.shorten(url, "x" * 21)  # Too long
     
-    @responses.activate
+    def test_shorten_rejects_non_ascii_extension(self):
+        """Test that extensions must be ASCII letters and digits."""
+        with pytest.raises(ValueError, match="Extension must contain only alphanumeric"):
+            Shortener.shorten("https://example.com", "café1")
+    
     def test_get_info_existing(self):
         """Test getting info for existing shortened URL."""
-        mock_response = {
-            "extension": "example",
-            "original_url": "https://example.com",
-            "clicks": 42
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/shorten/example",
-            json=mock_response,
-            status=200
-        )
-        
         result = Shortener.get_info("example")
         assert isinstance(result, dict)
         assert "extension" in result
     
-    @responses.activate
-    def test_get_info_not_found(self):
+    def test_get_info_not_found(self, mock_api):
         """Test getting info for non-existent shortened URL."""
-        responses.add(
+        mock_api.add(
             responses.GET,
-            "https://api.popcat.xyz/shorten/notfound",
+            SHORTEN_URL + "/notfound",
             status=404
         )
         
@@ -196,7 +188,13 @@ class TestShortener:
         
         with pytest.raises(ValueError, match="Extension must contain only alphanumeric"):
             Shortener.get_info("test-123")
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    
+    def test_get_info_cached(self, api_calls):
+        """Test that repeated lookups reuse the cached result until invalidated."""
+        first = Shortener.get_info("example")
+        assert Shortener.get_info("example") == first
+        assert len(api_calls) == 1
+        
+        Shortener.invalidate("example")
+        Shortener.get_info("example")
+        assert len(api_calls) == 2
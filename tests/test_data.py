@@ -2,236 +2,110 @@
 Tests for data module functions.
 """
 
-import unittest
-import popcat
-from unittest.mock import patch, Mock
-from popcat import data
+import inspect
+import re
+
+from popcat import PopcatAPIError, data
 import pytest
-import responses
 
+from ._helpers import assert_dict_has
+
+
+# Expected validation message, compiled once rather than on every pytest.raises
+_RE_TEXT = re.compile("Text must be a non-empty string")
 
-class TestDataAPIs(unittest.TestCase):
+# (function, arguments, key expected in the result) for each endpoint
+CASES = [
+    (data.weather, ("London",), "location"),
+    (data.github, ("octocat",), "username"),
+    (data.npm, ("express",), "name"),
+    (data.randomcolor, (), "hex"),
+    (data.country, ("Japan",), "name"),
+    (data.periodic_table, ("Carbon",), "name"),
+    (data.subreddit, ("python",), "name"),
+]
+
+
+class TestDataAPIs:
     """Test cases for data API functions."""
     
-    @responses.activate
-    def test_weather_function(self):
-        """Test weather data retrieval."""
-        place = "London"
-        mock_response = {
-            "location": "London, England",
-            "temperature": "15°C",
-            "condition": "Partly Cloudy",
-            "humidity": "65%"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/weather",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.weather(place)
-        assert isinstance(result, dict)
-        assert "location" in result
-    
-    def test_weather_invalid_place(self):
-        """Test weather function with invalid place."""
-        with pytest.raises(ValueError, match="Text must be a non-empty string"):
-            data.weather("")
+    @pytest.mark.parametrize("func,args,key", CASES, ids=[case[0].__name__ for case in CASES])
+    def test_endpoint(self, func, args, key):
+        """Test that each endpoint returns the decoded JSON body."""
+        result = func(*args)
+        assert_dict_has(result, key)
     
-    @responses.activate
-    def test_github_user_data(self):
-        """Test GitHub user data retrieval."""
-        username = "octocat"
-        mock_response = {
-            "username": "octocat",
-            "name": "The Octocat",
-            "public_repos": 8,
-            "followers": 9001
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/github",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.github(username)
-        assert isinstance(result, dict)
-        assert "username" in result
+    @pytest.mark.parametrize("color,query", [("#FF0000", "color=%23FF0000"), ("red", "color=red")])
+    def test_colorinfo(self, color, query, api_calls):
+        """Test color information with a hex code or a color name."""
+        result = data.colorinfo(color)
+        assert_dict_has(result, "hex")
+        assert api_calls[0].url == "https://api.popcat.xyz/colorinfo?" + query
     
-    @responses.activate
-    def test_npm_package_info(self):
-        """Test NPM package information retrieval."""
-        package_name = "express"
-        mock_response = {
-            "name": "express",
-            "version": "4.18.2",
-            "description": "Fast, unopinionated, minimalist web framework"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/npm",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.npm(package_name)
-        assert isinstance(result, dict)
-        assert "name" in result
+    def test_subreddit_removes_prefix(self, api_calls):
+        """Test that r/ prefix is removed from subreddit names."""
+        # Test with r/ prefix - should be stripped
+        data.subreddit("r/python")
+        assert api_calls[0].url == "https://api.popcat.xyz/subreddit?subreddit=python"
     
-    @responses.activate
-    def test_colorinfo_hex(self):
-        """Test color information with hex code."""
-        color = "#FF0000"
-        mock_response = {
-            "hex": "#FF0000",
-            "rgb": {"r": 255, "g": 0, "b": 0},
-            "name": "Red"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/colorinfo",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.colorinfo(color)
-        assert isinstance(result, dict)
-        assert "hex" in result
+    def test_argument_passed_by_keyword(self, api_calls):
+        """Test that generated functions keep their documented argument names."""
+        result = data.github(username="octocat")
+        assert result["username"] == "octocat"
+        assert api_calls[0].url == "https://api.popcat.xyz/github?user=octocat"
     
-    @responses.activate
-    def test_colorinfo_name(self):
-        """Test color information with color name."""
-        color = "red"
-        mock_response = {
-            "hex": "#FF0000",
-            "rgb": {"r": 255, "g": 0, "b": 0},
-            "name": "Red"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/colorinfo",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.colorinfo(color)
-        assert isinstance(result, dict)
+    def test_lookups_are_cached(self, api_calls):
+        """Test that repeated lookups reuse the cached result unless disabled."""
+        data.country("Japan")
+        data.country("Japan")
+        assert len(api_calls) == 1
+        
+        data.country("Japan", use_cache=False)
+        assert len(api_calls) == 2
     
-    @responses.activate
-    def test_randomcolor(self):
-        """Test random color generation."""
-        mock_response = {
-            "hex": "#3A7BD5",
-            "rgb": {"r": 58, "g": 123, "b": 213},
-            "name": "Steel Blue"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/randomcolor",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.randomcolor()
-        assert isinstance(result, dict)
-        assert "hex" in result
+    def test_randomcolor_not_cached(self, api_calls):
+        """Test that random colors are fetched on every call."""
+        data.randomcolor()
+        data.randomcolor()
+        assert len(api_calls) == 2
     
-    @responses.activate
-    def test_country_info(self):
-        """Test country information retrieval."""
-        country_name = "Japan"
-        mock_response = {
-            "name": "Japan",
-            "capital": "Tokyo",
-            "population": 125800000,
-            "currency": "Japanese Yen"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/country",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.country(country_name)
-        assert isinstance(result, dict)
-        assert "name" in result
+    def test_only_exact_str_accepted(self):
+        """Test that bytes and str subclasses are rejected before any request."""
+        class Name(str):
+            pass
+        
+        for value in (b"London", Name("London"), None):
+            with pytest.raises(ValueError, match=_RE_TEXT):
+                data.weather(value)
     
-    @responses.activate
-    def test_periodic_table(self):
-        """Test periodic table element data."""
-        element = "Carbon"
-        mock_response = {
-            "name": "Carbon",
-            "symbol": "C",
-            "atomic_number": 6,
-            "atomic_mass": "12.011"
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/periodic_table",
-            json=mock_response,
-            status=200
+    def test_argument_quoted_into_url(self, api_calls):
+        """Test that the argument is percent-encoded onto the URL, reserved characters included."""
+        data.weather("São Paulo/SP&x=1")
+        assert api_calls[0].url == (
+            "https://api.popcat.xyz/weather?q=S%C3%A3o%20Paulo%2FSP%26x%3D1"
         )
-        
-        result = data.periodic_table(element)
-        assert isinstance(result, dict)
-        assert "name" in result
     
-    @responses.activate
-    def test_subreddit_info(self):
-        """Test subreddit information retrieval."""
-        subreddit_name = "python"
-        mock_response = {
-            "name": "python",
-            "title": "Python",
-            "subscribers": 1200000,
-            "is_nsfw": False
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/subreddit",
-            json=mock_response,
-            status=200
-        )
-        
-        result = data.subreddit(subreddit_name)
-        assert isinstance(result, dict)
-        assert "name" in result
+    def test_non_json_body_raises_api_error(self, mock_api):
+        """Test that a 200 response that is not JSON raises PopcatAPIError."""
+        mock_api.add(mock_api.GET, "https://api.popcat.xyz/github",
+                     body="<html>Bad Gateway</html>", content_type="text/html", status=200)
+        
+        with pytest.raises(PopcatAPIError) as excinfo:
+            data.github("octocat")
+        assert excinfo.value.status == 200
+        assert excinfo.value.endpoint == "/github"
     
-    @responses.activate
-    def test_subreddit_removes_prefix(self):
-        """Test that r/ prefix is removed from subreddit names."""
-        subreddit_name = "python"
-        mock_response = {
-            "name": "python",
-            "title": "Python",
-            "active_users": 1000,
-            "members": 500000
-        }
-        
-        responses.add(
-            responses.GET,
-            "https://api.popcat.xyz/subreddit",
-            json=mock_response,
-            status=200
-        )
-        
-        # Test with r/ prefix - should be stripped
-        result = data.subreddit("r/python")
-        assert result["name"] == "python"
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    def test_generated_functions(self, api_calls):
+        """Test that endpoint functions have their documented signatures and URLs."""
+        assert data.github.__module__ == "popcat.data"
+        parameters = inspect.signature(data.github).parameters
+        assert list(parameters) == ["username", "use_cache"]
+        assert parameters["use_cache"].default is True
+        assert list(inspect.signature(data.randomcolor).parameters) == []
+        
+        data.github("octocat")
+        data.randomcolor()
+        assert [call.url for call in api_calls] == [
+            "https://api.popcat.xyz/github?user=octocat",
+            "https://api.popcat.xyz/randomcolor",
+        ]
@@ -0,0 +1,531 @@
+"""
+Tests for the shared HTTP layer.
+"""
+
+from popcat import _http
+from popcat import classes, data, image, meme, utilities
+import pytest
+import responses
+
+
+class TestSharedSession:
+    """Test cases for the pooled session used by the endpoint modules."""
+
+    def test_https_adapter_retries_transient_errors(self):
+        """Test that the HTTPS adapter is configured with retries."""
+        adapter = _http.SESSION.get_adapter("https://api.popcat.xyz/drake")
+        assert adapter.max_retries.total == 3
+        assert 500 in adapter.max_retries.status_forcelist
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter._pool_maxsize == 100
+
+    def test_post_is_not_retried(self):
+        """Test that only idempotent methods are retried."""
+        retry = _http.SESSION.get_adapter("https://api.popcat.xyz/code").max_retries
+        assert retry.is_retry("GET", 503)
+        assert not retry.is_retry("POST", 503)
+
+    @responses.activate
+    def test_requests_go_through_shared_session(self):
+        """Test that endpoint modules reuse the shared session."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lulcat",
+            json={"url": "https://example.com/lulcat.png"},
+            status=200
+        )
+
+        meme.lulcat("hello")
+        assert len(responses.calls) == 1
+
+        from popcat import data, random
+
+        assert meme.BASE_URL == image.BASE_URL == data.BASE_URL == random.BASE_URL == _http.BASE_URL
+
+    def test_requests_use_connect_and_read_timeouts(self, monkeypatch):
+        """Test that every request carries the shared (connect, read) timeout."""
+        seen = {}
+
+        def fake_request(method, url, **kwargs):
+            seen.update(kwargs)
+            raise _http.requests.ConnectionError("offline")
+
+        monkeypatch.setattr(_http.SESSION, "request", fake_request)
+        with pytest.raises(_http.PopcatAPIError):
+            meme.lulcat("hello")
+        assert seen["timeout"] == (3.05, 10)
+
+    def test_set_timeout_applies_to_next_request(self, monkeypatch):
+        """Test that set_timeout() changes the timeout passed on each request."""
+        seen = {}
+
+        def fake_request(method, url, **kwargs):
+            seen.update(kwargs)
+            raise _http.requests.ConnectionError("offline")
+
+        monkeypatch.setattr(_http.SESSION, "request", fake_request)
+        monkeypatch.setattr(_http, "DEFAULT_TIMEOUT", _http.DEFAULT_TIMEOUT)
+        _http.set_timeout(1, 30)
+        with pytest.raises(_http.PopcatAPIError):
+            meme.lulcat("hello")
+        assert seen["timeout"] == (1, 30)
+
+        with pytest.raises(ValueError, match="Timeouts must be positive"):
+            _http.set_timeout(0, 30)
+
+    @responses.activate
+    def test_compression_and_user_agent_headers(self):
+        """Test that requests advertise compression and identify the wrapper."""
+        import popcat
+
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lulcat",
+            json={"url": "https://example.com/lulcat.png"},
+            status=200
+        )
+
+        meme.lulcat("hello")
+        headers = responses.calls[0].request.headers
+        assert "gzip" in headers["Accept-Encoding"]
+        assert headers["User-Agent"] == f"pop-wrapper/{popcat.__version__}"
+
+    def test_brotli_advertised_only_when_decodable(self):
+        """Test that br is only requested when a Brotli decoder is installed."""
+        import importlib.util
+
+        has_brotli = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+        encodings = _http.SESSION.headers["Accept-Encoding"].split(",")
+        assert ("br" in encodings) == has_brotli
+
+    def test_json_decoded_with_orjson_when_installed(self):
+        """Test that orjson is preferred for decoding JSON bodies."""
+        orjson = pytest.importorskip("orjson")
+        assert _http._loads is orjson.loads
+
+    @responses.activate
+    def test_random_falls_back_to_text_for_non_json(self):
+        """Test that non-JSON random responses are returned as text."""
+        from popcat import random
+
+        responses.add(responses.GET, "https://api.popcat.xyz/showerthought", body="plain text")
+
+        assert random.showerthought() == "plain text"
+
+    @pytest.mark.parametrize("body, expected", [
+        (b'{"joke": "Knock knock"}', "Knock knock"),
+        (b'{"answer": "Yes"}', "Yes"),
+        (b'{"joke": "Knock knock", "id": 1}', {"joke": "Knock knock", "id": 1}),
+        (b'{"title": "Meme"}', {"title": "Meme"}),
+        (b'["joke"]', ["joke"]),
+        (b'5', 5),
+        (b'true', True),
+        (b'null', None),
+    ])
+    def test_random_unwraps_single_field_responses(self, body, expected):
+        """Test that only single-field joke/fact/answer responses are unwrapped, and scalars pass through."""
+        from popcat.random import _parse_body
+
+        assert _parse_body(body, body.decode()) == expected
+
+    @responses.activate
+    def test_data_and_random_use_shared_session(self):
+        """Test that data and random reuse the shared session."""
+        from popcat import data, random
+
+        responses.add(responses.GET, "https://api.popcat.xyz/github", json={"login": "octocat"})
+        responses.add(responses.GET, "https://api.popcat.xyz/joke", json={"joke": "Knock knock"})
+
+        session = _http.SESSION
+        assert data.github("octocat") == {"login": "octocat"}
+        assert random.joke() == "Knock knock"
+        assert _http.SESSION is session
+
+    def test_close_reopens_session(self):
+        """Test that close() drops the pool and a new one is opened on demand."""
+        session = _http.SESSION
+        _http.close()
+        assert _http.SESSION is not session
+
+    def test_text_utilities_and_classes_use_shared_session(self, monkeypatch):
+        """Test that text, utilities and classes send requests through the shared session."""
+        from popcat import classes, text, utilities
+
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append((method, url))
+            raise _http.requests.ConnectionError("offline")
+
+        monkeypatch.setattr(_http.SESSION, "request", fake_request)
+
+        for func, args in [
+            (text.mock, ("hello",)),
+            (utilities.lyrics, ("Bohemian Rhapsody",)),
+            (classes.Shortener.shorten, ("https://example.com", "example")),
+        ]:
+            with pytest.raises(_http.PopcatAPIError):
+                func(*args)
+
+        assert calls == [
+            ("GET", "https://api.popcat.xyz/mock"),
+            ("GET", "https://api.popcat.xyz/lyrics"),
+            ("POST", "https://api.popcat.xyz/shorten"),
+        ]
+
+    @responses.activate
+    def test_request_failure_raises(self):
+        """Test that HTTP errors are surfaced as API failures."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lulcat",
+            status=500
+        )
+
+        with pytest.raises(Exception, match="API request failed"):
+            meme.lulcat("hello")
+
+    @responses.activate
+    def test_request_failure_keeps_cause(self):
+        """Test that API failures raise PopcatAPIError chained to the original error."""
+        import requests
+
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lulcat",
+            status=500
+        )
+
+        with pytest.raises(_http.PopcatAPIError) as excinfo:
+            meme.lulcat("hello")
+        assert isinstance(excinfo.value.__cause__, requests.HTTPError)
+        assert excinfo.value.status == 500
+        assert excinfo.value.endpoint == "/lulcat"
+
+    @pytest.mark.parametrize("call,endpoint", [
+        (lambda: meme.lulcat("hello"), "/lulcat"),
+        (lambda: utilities.lyrics("Bohemian Rhapsody"), "/lyrics"),
+        (lambda: classes.Shortener.get_info("example"), "/shorten/example"),
+    ], ids=["lulcat", "lyrics", "get_info"])
+    @responses.activate
+    def test_non_json_body_raises_api_error(self, call, endpoint):
+        """Test that a 200 response that is not JSON raises PopcatAPIError, not ValueError."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz" + endpoint,
+            body="<html>Bad Gateway</html>",
+            content_type="text/html",
+            status=200
+        )
+
+        with pytest.raises(_http.PopcatAPIError, match="API request failed") as excinfo:
+            call()
+        assert isinstance(excinfo.value.__cause__, ValueError)
+        assert excinfo.value.status == 200
+        assert excinfo.value.endpoint == endpoint
+
+    def test_connection_failure_has_no_status(self, monkeypatch):
+        """Test that failures without a response leave the status unset."""
+        def fake_request(method, url, **kwargs):
+            raise _http.requests.ConnectionError("offline")
+
+        monkeypatch.setattr(_http.SESSION, "request", fake_request)
+
+        with pytest.raises(_http.PopcatAPIError) as excinfo:
+            meme.lulcat("hello")
+        assert excinfo.value.status is None
+        assert excinfo.value.endpoint == "/lulcat"
+
+
+class TestLocalUrls:
+    """Test cases for URL-only endpoints built without a network round trip."""
+
+    @responses.activate
+    def test_build_url_skips_network(self):
+        """Test that URL-only endpoints do not contact the API."""
+        result = meme.drake("Using other APIs", "Using Popcat API")
+        assert result == (
+            "https://api.popcat.xyz/drake"
+            "?text1=Using+other+APIs&text2=Using+Popcat+API"
+        )
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_verify_sends_head_request(self):
+        """Test that verify=True confirms the image with a HEAD request."""
+        responses.add(
+            responses.HEAD,
+            "https://api.popcat.xyz/jail",
+            status=200
+        )
+
+        result = image.jail("https://example.com/image.png", verify=True)
+        assert result.startswith("https://api.popcat.xyz/jail?image=")
+        assert responses.calls[0].request.method == "HEAD"
+
+    @responses.activate
+    def test_verify_failure_raises(self):
+        """Test that a failed verification is surfaced as an API failure."""
+        responses.add(
+            responses.HEAD,
+            "https://api.popcat.xyz/jail",
+            status=404
+        )
+
+        with pytest.raises(Exception, match="API request failed"):
+            image.jail("https://example.com/image.png", verify=True)
+
+
+class TestResponseCache:
+    """Test cases for the in-memory response cache."""
+
+    @responses.activate
+    def test_repeated_json_request_is_cached(self):
+        """Test that identical requests are served from the cache."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lulcat",
+            json={"url": "https://example.com/lulcat.png"},
+            status=200
+        )
+
+        first = meme.lulcat("hello")
+        second = meme.lulcat("hello")
+        assert first == second
+        assert len(responses.calls) == 1
+
+        meme.lulcat("goodbye")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_clear_cache_forces_new_request(self):
+        """Test that clear_cache() invalidates cached responses."""
+        import popcat
+
+        responses.add(
+            responses.HEAD,
+            "https://api.popcat.xyz/jail",
+            status=200
+        )
+
+        image.jail("https://example.com/image.png", verify=True)
+        image.jail("https://example.com/image.png", verify=True)
+        assert len(responses.calls) == 1
+
+        popcat.clear_cache()
+        image.jail("https://example.com/image.png", verify=True)
+        assert len(responses.calls) == 2
+
+    @pytest.mark.parametrize("call", [
+        lambda: data.country("Japan"),
+        lambda: meme.lulcat("hello"),
+        lambda: classes.Shortener.get_info("example"),
+    ], ids=["country", "lulcat", "get_info"])
+    def test_mutating_result_leaves_cache_intact(self, call, api_calls):
+        """Test that changing a returned dict does not change later cached results."""
+        first = call()
+        expected = dict(first)
+        first["injected"] = True
+        first.pop(next(iter(expected)))
+
+        assert call() == expected
+        assert len(api_calls) == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        """Test that entries expire after their time-to-live."""
+        from popcat import _cache
+
+        now = [1000.0]
+        monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+        cache = _cache.TTLCache(maxsize=2, ttl=60)
+        cache["a"] = 1
+        assert cache.get("a") == 1
+
+        now[0] += 61
+        assert cache.get("a") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        from popcat._cache import TTLCache
+
+        cache = TTLCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestBackends:
+    """Test cases for selecting the HTTP backend."""
+
+    def test_unknown_backend_rejected(self):
+        """Test that unknown backend names raise ValueError."""
+        with pytest.raises(ValueError, match="Backend must be one of"):
+            _http.set_backend("curl")
+
+    def test_httpx_backend(self, monkeypatch):
+        """Test that requests are dispatched through httpx when selected."""
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            if request.url.path == "/lulcat":
+                return httpx.Response(200, json={"url": "https://example.com/lulcat.png"})
+            assert request.method == "HEAD"
+            return httpx.Response(200)
+
+        monkeypatch.setattr(_http, "_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+        monkeypatch.setattr(_http, "_backend", "httpx")
+
+        assert meme.lulcat("hello") == {"url": "https://example.com/lulcat.png"}
+        result = image.jail("https://example.com/image.png", verify=True)
+        assert isinstance(result, str)
+        assert result.startswith("https://api.popcat.xyz/jail?image=")
+
+    def test_httpx_backend_failure_raises(self, monkeypatch):
+        """Test that httpx errors are surfaced as API failures."""
+        httpx = pytest.importorskip("httpx")
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(503))
+        monkeypatch.setattr(_http, "_CLIENT", httpx.Client(transport=transport))
+        monkeypatch.setattr(_http, "_backend", "httpx")
+
+        with pytest.raises(Exception, match="API request failed"):
+            meme.lulcat("hello")
+
+    def test_urllib3_backend(self, monkeypatch):
+        """Test that requests are dispatched through the urllib3 pool when selected."""
+        import io
+        from types import SimpleNamespace
+
+        from urllib3.response import HTTPResponse
+
+        calls = []
+
+        def request(method, url, body=None, headers=None, timeout=None):
+            calls.append((method, url, body))
+            if url.endswith("/fail"):
+                return HTTPResponse(body=io.BytesIO(b""), status=503, reason="Service Unavailable")
+            return HTTPResponse(body=io.BytesIO(b'{"url": "https://example.com/lulcat.png"}'),
+                                headers={"Content-Type": "application/json"}, status=200)
+
+        pool = SimpleNamespace(headers={"User-Agent": "test"}, request=request)
+        monkeypatch.setattr(_http, "_POOL", pool)
+        monkeypatch.setattr(_http, "_backend", "urllib3")
+
+        assert meme.lulcat("hello world") == {"url": "https://example.com/lulcat.png"}
+        assert _http.post_json("/shorten", json={"url": "https://example.com"}) == {
+            "url": "https://example.com/lulcat.png"
+        }
+        assert calls[0] == ("GET", "https://api.popcat.xyz/lulcat?text=hello+world", None)
+        assert calls[1] == ("POST", "https://api.popcat.xyz/shorten", b'{"url": "https://example.com"}')
+
+        with pytest.raises(_http.PopcatAPIError, match="503") as excinfo:
+            _http.get("/fail")
+        assert excinfo.value.status == 503
+
+    def test_urllib3_pool_shares_tls_context(self):
+        """Test that urllib3 pools reuse one TLS context across close()."""
+        import ssl
+
+        context = _http._get_pool().connection_pool_kw["ssl_context"]
+        _http.close()
+
+        assert _http._get_pool().connection_pool_kw["ssl_context"] is context
+        assert context.check_hostname
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        _http.close()
+
+
+class TestHeadRequests:
+    """Test cases for endpoints resolved without downloading the image."""
+
+    @responses.activate
+    def test_screenshot_uses_head(self):
+        """Test that screenshot() resolves its URL with a HEAD request."""
+        from popcat import utilities
+
+        responses.add(
+            responses.HEAD,
+            "https://api.popcat.xyz/screenshot",
+            status=200
+        )
+
+        result = utilities.screenshot("https://github.com")
+        assert result.startswith("https://api.popcat.xyz/screenshot?url=")
+        assert responses.calls[0].request.method == "HEAD"
+
+
+class TestInlineValidation:
+    """Test cases for validation inlined into the generated endpoints."""
+
+    @pytest.mark.parametrize("value, message", [
+        ("", "Image URL must be a non-empty string"),
+        (None, "Image URL must be a non-empty string"),
+        ("ftp://example.com/image.png", "Image URL must start with http"),
+    ])
+    def test_image_endpoint_matches_shared_validator(self, value, message):
+        """Test that generated image endpoints reject the same input as _validate_image_url."""
+        from popcat._validate import _validate_image_url
+
+        with pytest.raises(ValueError, match=message):
+            _validate_image_url(value)
+        with pytest.raises(ValueError, match=message):
+            image.blur(value)
+        with pytest.raises(ValueError, match=message):
+            image.jail(value)
+
+    @pytest.mark.parametrize("args", [("",), (None,), (123,)])
+    def test_text_endpoint_rejects_invalid_text(self, args):
+        """Test that generated meme endpoints reject invalid text."""
+        with pytest.raises(ValueError, match="Text must be a non-empty string"):
+            meme.supreme(*args)
+        with pytest.raises(ValueError, match="Text must be a non-empty string"):
+            meme.drake("valid", *args)
+
+
+class TestTextCache:
+    """Test cases for caching text transforms and lyrics."""
+
+    @responses.activate
+    def test_text_transform_is_cached(self):
+        """Test that identical text transforms are served from the cache."""
+        from popcat import text
+
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/mock",
+            json={"text": "hElLo"},
+            status=200
+        )
+
+        assert text.mock("hello") == "hElLo"
+        assert text.mock("hello") == "hElLo"
+        assert len(responses.calls) == 1
+
+        text.mock("hello", use_cache=False)
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_lyrics_cache_expires(self, monkeypatch):
+        """Test that cached lyrics expire after five minutes."""
+        from popcat import _cache, utilities
+
+        now = [1000.0]
+        monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/lyrics",
+            json={"title": "Bohemian Rhapsody"},
+            status=200
+        )
+
+        utilities.lyrics("Bohemian Rhapsody")
+        utilities.lyrics("Bohemian Rhapsody")
+        assert len(responses.calls) == 1
+
+        now[0] += 301
+        utilities.lyrics("Bohemian Rhapsody")
+        assert len(responses.calls) == 2
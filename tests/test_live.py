@@ -0,0 +1,36 @@
+"""
+Tests against the live Popcat API.
+
+These make real HTTPS requests, so they are marked slow, which the default run
+deselects, and skipped unless ``POPCAT_LIVE_TESTS=1`` is set. Run them with
+``POPCAT_LIVE_TESTS=1 pytest -m slow``.
+"""
+
+import os
+
+import pytest
+
+import popcat
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.slow,
+    pytest.mark.enable_socket,
+    pytest.mark.usefixtures("live_api"),
+    pytest.mark.skipif(os.environ.get("POPCAT_LIVE_TESTS") != "1",
+                       reason="set POPCAT_LIVE_TESTS=1 to call the live API"),
+]
+
+
+class TestLiveAPI:
+    """Test cases for calls to the live API."""
+
+    def test_joke(self):
+        """Test that a joke is returned as text."""
+        joke = popcat.joke()
+        assert isinstance(joke, str) and joke
+
+    def test_fact(self):
+        """Test that a fact is returned as text."""
+        fact = popcat.fact()
+        assert isinstance(fact, str) and fact
@@ -0,0 +1,72 @@
+"""
+Tests for the top-level popcat package.
+"""
+
+import importlib
+import subprocess
+import sys
+
+import popcat
+import pytest
+
+
+class TestLazyImports:
+    """Test cases for the lazily imported package namespace."""
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing popcat does not import the endpoint modules."""
+        code = (
+            "import sys, popcat; "
+            "print(any(name.startswith('popcat.') for name in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_endpoint_modules_defer_requests_import(self):
+        """Test that requests is imported on the first request, not at import time."""
+        code = (
+            "import sys, popcat.text, popcat.utilities, popcat.classes, popcat.meme, popcat.image, "
+            "popcat.data, popcat.random; "
+            "print('requests' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_function_resolved_on_access(self):
+        """Test that public functions resolve to their submodule definitions."""
+        from popcat import meme
+
+        assert popcat.drake is meme.drake
+
+    def test_submodule_resolved_on_access(self):
+        """Test that submodules are still reachable as attributes."""
+        assert popcat.image.jail is popcat.jail
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            popcat.not_an_endpoint
+
+
+class TestExports:
+    """Test cases for the package-level export list."""
+
+    @pytest.mark.parametrize("module", sorted(popcat._EXPORTS))
+    def test_exports_match_submodule_all(self, module):
+        """Test that the package export table agrees with each submodule's __all__."""
+        submodule = importlib.import_module(f"popcat.{module}")
+        assert set(popcat._EXPORTS[module]) == set(submodule.__all__)
+
+    def test_all_has_no_duplicates(self):
+        """Test that no public name is exported by two submodules."""
+        assert len(popcat.__all__) == sum(len(names) for names in popcat._EXPORTS.values())
+
+    def test_star_import_resolves_every_name(self):
+        """Test that every name in __all__ resolves."""
+        namespace = {}
+        exec("from popcat import *", namespace)
+        assert set(popcat.__all__) <= set(namespace)
+
+    def test_8ball_is_eightball(self):
+        """Test that _8ball is the eightball function itself, not a wrapper."""
+        assert popcat._8ball is popcat.eightball
@@ -0,0 +1,127 @@
+"""
+Tests for text utility functions.
+"""
+
+from popcat import text
+import pytest
+import responses
+
+
+class TestLocalTransforms:
+    """Test cases for transforms computed without the API."""
+
+    @responses.activate
+    def test_reverse(self):
+        """Test local text reversal."""
+        assert text.reverse("Hello World") == "dlroW olleH"
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_doublestruck(self):
+        """Test local double-struck conversion, including Letterlike Symbols capitals."""
+        assert text.doublestruck("Hello") == "ℍ𝕖𝕝𝕝𝕠"
+        assert text.doublestruck("Python 3") == "ℙ𝕪𝕥𝕙𝕠𝕟 𝟛"
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_encode_decode_round_trip(self):
+        """Test local binary encoding and decoding."""
+        assert text.encode("Hi") == "01001000 01101001"
+        assert text.decode("01001000 01101001") == "Hi"
+        assert text.decode(text.encode("héllo ✓")) == "héllo ✓"
+        assert len(responses.calls) == 0
+
+    def test_decode_rejects_oversized_chunks(self):
+        """Test that chunks wider than a byte are rejected."""
+        with pytest.raises(ValueError, match="8-bit chunks"):
+            text.decode("111111111")
+
+    @responses.activate
+    def test_remote_uses_api(self):
+        """Test that remote=True asks the API instead."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/reverse",
+            json={"text": "dlroW olleH"},
+            status=200
+        )
+
+        assert text.reverse("Hello World", remote=True) == "dlroW olleH"
+        assert len(responses.calls) == 1
+
+
+class TestBinaryValidation:
+    """Test cases for decode input validation."""
+
+    @pytest.mark.parametrize("binary", ["0102", "01001000 0110100x", "0b0100"])
+    def test_non_binary_rejected(self, binary):
+        """Test that characters other than 0, 1 and whitespace are rejected."""
+        with pytest.raises(ValueError, match="only 0s and 1s"):
+            text.decode(binary)
+
+    def test_whitespace_between_chunks_allowed(self):
+        """Test that spaces, tabs and newlines may separate chunks."""
+        assert text.decode("01001000\t01101001\n") == "Hi"
+
+
+class TestResponseParsing:
+    """Test cases for reading results out of API responses."""
+
+    @responses.activate
+    def test_json_result_key(self):
+        """Test that the result is taken from the endpoint's result key."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/texttomorse",
+            json={"morse": "... --- ..."},
+            status=200
+        )
+
+        assert text.texttomorse("SOS") == "... --- ..."
+
+    @responses.activate
+    def test_missing_key_falls_back_to_body(self):
+        """Test that a JSON body without the expected key is returned as text."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/texttomorse",
+            json={"error": "unexpected"},
+            status=200
+        )
+
+        assert text.texttomorse("SOS") == '{"error": "unexpected"}'
+
+    @responses.activate
+    def test_plain_text_response(self):
+        """Test that non-JSON responses are returned as text."""
+        responses.add(
+            responses.GET,
+            "https://api.popcat.xyz/mock",
+            body="tHiS iS a TeSt",
+            content_type="text/plain",
+            status=200
+        )
+
+        assert text.mock("This is a test") == "tHiS iS a TeSt"
+
+
+class TestTranslateBatch:
+    """Test cases for translating lists of texts in parallel."""
+
+    @responses.activate
+    def test_results_keep_input_order(self):
+        """Test that translations come back in the order of the inputs."""
+        responses.add_callback(
+            responses.GET,
+            "https://api.popcat.xyz/translate",
+            callback=lambda request: (200, {"Content-Type": "application/json"},
+                                      '{"translated": "%s"}' % request.params["text"].upper()),
+        )
+
+        assert text.translate_batch(["one", "two", "three"], "es") == ["ONE", "TWO", "THREE"]
+        assert len(responses.calls) == 3
+
+    def test_invalid_language_rejected(self):
+        """Test that the language code is validated before any request."""
+        with pytest.raises(ValueError, match="Text must be a non-empty string"):
+            text.translate_batch(["one"], "")
@@ -0,0 +1,52 @@
+"""
+Tests for utility functions.
+"""
+
+from popcat import utilities
+import pytest
+import responses
+
+
+class TestUrlValidation:
+    """Test cases for URL validation in screenshot and welcomecard."""
+
+    @pytest.mark.parametrize("url, message", [
+        ("", "URL must be a non-empty string"),
+        ("github.com", "URL must be a valid HTTP/HTTPS URL"),
+        ("ftp://github.com", "URL must use HTTP or HTTPS protocol"),
+    ])
+    def test_screenshot_invalid_url(self, url, message):
+        """Test that invalid URLs are rejected before any request."""
+        with pytest.raises(ValueError, match=message):
+            utilities.screenshot(url)
+
+    @pytest.mark.parametrize("background, message", [
+        ("https://example.com/bg.jpg", "must be a PNG file"),
+        ("http://example.com/bg.png", "must use HTTPS"),
+    ])
+    def test_welcomecard_invalid_background(self, background, message):
+        """Test that the background must be an HTTPS PNG."""
+        with pytest.raises(ValueError, match=message):
+            utilities.welcomecard(background, "https://example.com/avatar.png", "Welcome", "Alice", "Hi")
+
+    @pytest.mark.parametrize("texts", [("", "Alice", "Hi"), ("Welcome", None, "Hi"), ("Welcome", "Alice", 3)])
+    def test_welcomecard_invalid_text(self, texts):
+        """Test that each of the three text lines is required."""
+        with pytest.raises(ValueError, match="Text must be a non-empty string"):
+            utilities.welcomecard("https://example.com/bg.png", "https://example.com/avatar.png", *texts)
+
+    @responses.activate
+    def test_welcomecard_png_with_query_string(self):
+        """Test that a PNG background with a query string is accepted."""
+        responses.add(
+            responses.HEAD,
+            "https://api.popcat.xyz/welcomecard",
+            status=200
+        )
+
+        result = utilities.welcomecard(
+            "https://example.com/bg.png?size=large",
+            "https://example.com/avatar.png",
+            "Welcome", "Alice", "to the server"
+        )
+        assert result.startswith("https://api.popcat.xyz/welcomecard?")
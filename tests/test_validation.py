@@ -0,0 +1,39 @@
+"""
+Tests for input validation shared across the endpoint modules.
+"""
+
+import re
+
+import pytest
+
+from popcat import data, image, meme
+
+# Expected messages, compiled once rather than on every pytest.raises
+_RE_TEXT = re.compile("Text must be a non-empty string")
+_RE_TEXT_LENGTH = re.compile("Text must be 125 characters or less")
+_RE_IMAGE_URL = re.compile("Image URL must be a non-empty string")
+_RE_IMAGE_SCHEME = re.compile("Image URL must start with http")
+_RE_COLOR = re.compile("Color must be a non-empty string")
+
+# (function, arguments, expected error message pattern) for inputs rejected before any request
+INVALID_CASES = [
+    (data.weather, ("",), _RE_TEXT),
+    (image.jail, ("not-a-url",), _RE_IMAGE_SCHEME),
+    (image.jail, ("",), _RE_IMAGE_URL),
+    (image.colorify, ("https://example.com/image.png", ""), _RE_COLOR),
+    (meme.drake, ("", "valid text"), _RE_TEXT),
+    (meme.drake, ("valid text", ""), _RE_TEXT),
+    (meme.ship, ("not-a-url", "https://example.com/image.jpg"), _RE_IMAGE_SCHEME),
+    (meme.quote, ("https://example.com/image.jpg", "x" * 126, "Test Name"), _RE_TEXT_LENGTH),
+]
+
+
+class TestValidation:
+    """Test cases for rejected inputs."""
+    
+    @pytest.mark.parametrize("func,args,match", INVALID_CASES,
+                             ids=[f"{case[0].__name__}-{i}" for i, case in enumerate(INVALID_CASES)])
+    def test_invalid_input_raises(self, func, args, match):
+        """Test that invalid input raises ValueError with a descriptive message."""
+        with pytest.raises(ValueError, match=match):
+            func(*args)